@@ -8,58 +8,120 @@ This file serves as the entry point for the application.
 
 import os
 import sys
+import argparse
+import importlib.util
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import logging.config
+import logging.handlers
+import queue
+import atexit
+
+# Logging configuration, applied once from main()
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Records are enqueued by the caller and written by a QueueListener thread,
+# so log I/O never blocks the Tk main loop
+LOG_QUEUE = queue.Queue(-1)
+
+LOGGING_CONFIG = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'queue': {
+            '()': 'logging.handlers.QueueHandler',
+            'queue': LOG_QUEUE,
+        },
+    },
+    'loggers': {
+        'src': {
+            'level': 'INFO',
+        },
+    },
+    'root': {
+        'level': 'INFO',
+        'handlers': ['queue'],
+    },
+}
+
+
+def create_log_listener():
+    """Create the listener that writes queued log records to file and console."""
+    from src.core.paths import LOGS_DIR
+    
+    formatter = logging.Formatter(LOG_FORMAT)
+    
+    file_handler = logging.FileHandler(os.path.join(LOGS_DIR, 'app.log'), encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    
+    # Buffer file writes; errors flush immediately so crash details are kept
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=file_handler
+    )
+    atexit.register(memory_handler.flush)
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    
+    return logging.handlers.QueueListener(
+        LOG_QUEUE, memory_handler, console_handler, respect_handler_level=True
+    )
+
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("app.log"),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Required packages checked before the GUI starts
+REQUIRED_DEPENDENCIES = ("PIL", "exifread")
+
 # Ensure the src package is in the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-try:
-    from src.gui.main_window import MainWindow
-    from src.utils.logger import setup_exception_logging
-except ImportError as e:
-    logger.critical(f"Failed to import required modules: {e}")
-    messagebox.showerror("Import Error", 
-                         f"Failed to load required modules: {e}\n\n"
-                         "Please ensure all dependencies are installed.")
-    sys.exit(1)
-
 
 class ImageMetadataExtractorApp:
     """Main application class for the Image Metadata Extractor."""
     
+    # Minimum window size (width, height)
+    MIN_WINDOW_SIZE = (900, 600)
+    
+    # ThemedStyle class from ttkthemes, looked up once per process
+    _themed_style_cls = None
+    _themed_style_checked = False
+    
     def __init__(self):
         """Initialize the application."""
         self.root = tk.Tk()
         self.root.title("Image Metadata Extractor")
         
+        # Decoded icon images, keyed by file path; a PhotoImage belongs to
+        # the Tk interpreter that created it, so the cache is per window
+        self._icon_cache = {}
+        
         # Set minimum window size
-        self.root.minsize(900, 600)
+        self.root.minsize(*self.MIN_WINDOW_SIZE)
         
         # Set window icon if available
-        icon_path = os.path.join(os.path.dirname(__file__), "resources", "icons", "app_icon.png")
-        if os.path.exists(icon_path):
-            try:
-                icon = tk.PhotoImage(file=icon_path)
-                self.root.iconphoto(True, icon)
-            except Exception as e:
-                logger.warning(f"Could not load application icon: {e}")
+        from src.core.paths import ICONS_DIR
+        icon_path = os.path.join(ICONS_DIR, "app_icon.png")
+        try:
+            self.root.iconphoto(True, self._load_icon(icon_path))
+        except (FileNotFoundError, tk.TclError) as e:
+            logger.debug(f"Could not load application icon: {e}")
         
         # Apply theme
         self._setup_theme()
         
+        # Import the GUI tree only once the root window exists
+        try:
+            from src.gui.main_window import MainWindow
+            from src.utils.logger import setup_exception_logging
+        except ImportError as e:
+            logger.critical(f"Failed to import required modules: {e}")
+            messagebox.showerror("Import Error", 
+                                 f"Failed to load required modules: {e}\n\n"
+                                 "Please ensure all dependencies are installed.")
+            sys.exit(1)
+        
         # Setup exception handling
         setup_exception_logging()
         
@@ -74,29 +136,51 @@ class ImageMetadataExtractorApp:
         
         logger.info("Application initialized successfully")
 
+    def _load_icon(self, path):
+        """Load an icon image, reusing the decoded image on later calls."""
+        icon = self._icon_cache.get(path)
+        if icon is None:
+            icon = tk.PhotoImage(master=self.root, file=path)
+            self._icon_cache[path] = icon
+        return icon
+
+    @classmethod
+    def _get_themed_style_cls(cls):
+        """Return ttkthemes' ThemedStyle if installed, caching the lookup."""
+        if not cls._themed_style_checked:
+            if importlib.util.find_spec("ttkthemes") is not None:
+                try:
+                    from ttkthemes import ThemedStyle
+                    cls._themed_style_cls = ThemedStyle
+                except ImportError:
+                    cls._themed_style_cls = None
+            cls._themed_style_checked = True
+        return cls._themed_style_cls
+
     def _setup_theme(self):
         """Setup the application theme."""
-        try:
-            # Try to import and use ttkthemes for better looking UI
-            from ttkthemes import ThemedStyle
-            style = ThemedStyle(self.root)
+        themed_style_cls = self._get_themed_style_cls()
+        if themed_style_cls is not None:
+            # Use ttkthemes for better looking UI
+            style = themed_style_cls(self.root)
             style.set_theme("arc")  # Use a modern theme
-        except ImportError:
+        else:
             # Fall back to default style if ttkthemes is not available
             logger.info("ttkthemes not available, using default theme")
             style = ttk.Style()
             style.theme_use('clam' if 'clam' in style.theme_names() else 'default')
-        
-        # Configure common styles
-        style.configure('TButton', font=('Helvetica', 10))
-        style.configure('TLabel', font=('Helvetica', 10))
-        style.configure('TFrame', background='#f0f0f0')
+            
+            # Configure common styles; an external theme provides its own
+            style.configure('TButton', font=('Helvetica', 10))
+            style.configure('TLabel', font=('Helvetica', 10))
+            style.configure('TFrame', background='#f0f0f0')
 
     def _center_window(self):
         """Center the window on the screen."""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        # Use the requested size rather than forcing a layout pass
+        min_width, min_height = self.MIN_WINDOW_SIZE
+        width = max(self.root.winfo_reqwidth(), min_width)
+        height = max(self.root.winfo_reqheight(), min_height)
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
@@ -137,9 +221,57 @@ class ImageMetadataExtractorApp:
             logger.info("Application terminated")
 
 
+def find_missing_dependency():
+    """
+    Find the first required dependency that is not installed.
+    
+    Packages are located with importlib.util.find_spec, which does not
+    import them.
+    
+    Returns:
+        str: Name of the missing package, or None if all are installed
+    """
+    for package in REQUIRED_DEPENDENCIES:
+        if importlib.util.find_spec(package) is None:
+            return package
+    
+    return None
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Image Metadata Extractor")
+    parser.add_argument(
+        "--skip-dep-check",
+        action="store_true",
+        help="skip checking that required dependencies are installed"
+    )
+    args, _ = parser.parse_known_args()
+    return args
+
+
+def stop_log_listener(listener):
+    """Write out queued log records and stop the listener thread."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+
+
 def main():
     """Application entry point."""
+    args = parse_args()
+    log_listener = None
+    
     try:
+        # Create application directories and configure logging
+        from src.core.paths import ensure_paths
+        ensure_paths()
+        logging.config.dictConfig(LOGGING_CONFIG)
+        
+        # Start writing queued log records before anything is logged
+        log_listener = create_log_listener()
+        log_listener.start()
+        
         # Check Python version
         if sys.version_info < (3, 6):
             messagebox.showerror(
@@ -148,14 +280,12 @@ def main():
             )
             sys.exit(1)
             
-        # Check for required dependencies
-        try:
-            import PIL
-            import exifread
-        except ImportError as e:
+        # Check for required dependencies without importing them
+        missing = None if args.skip_dep_check else find_missing_dependency()
+        if missing is not None:
             messagebox.showerror(
                 "Missing Dependencies",
-                f"Required dependency not found: {e}\n\n"
+                f"Required dependency not found: {missing}\n\n"
                 "Please install all required dependencies using:\n"
                 "pip install -r requirements.txt"
             )
@@ -172,6 +302,10 @@ def main():
             f"Failed to start the application:\n{str(e)}"
         )
         sys.exit(1)
+    finally:
+        # Runs on sys.exit() too, so startup failures reach the log file
+        if log_listener is not None:
+            stop_log_listener(log_listener)
 
 
 if __name__ == "__main__":
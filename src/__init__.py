@@ -28,10 +28,6 @@ package_info = {
     'url': 'https://github.com/yourusername/ImageMetadataExtractor',
 }
 
-# Import key components for easier access
-from src.core.metadata_extractor import MetadataExtractor
-from src.core.file_handler import FileHandler
-
 # Define what gets imported with "from src import *"
 __all__ = [
     'MetadataExtractor',
@@ -39,60 +35,50 @@ __all__ = [
     'package_info',
 ]
 
-# Setup logging for the package
 import logging
 import os
 
-# Create logs directory if it doesn't exist
-logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
-if not os.path.exists(logs_dir):
-    os.makedirs(logs_dir)
-
-# Configure package-level logger
+# Package-level logger; handlers are configured once by the application
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-
-# Prevent duplicate handlers
-if not logger.handlers:
-    # File handler
-    file_handler = logging.FileHandler(os.path.join(logs_dir, 'image_metadata_extractor.log'))
-    file_handler.setLevel(logging.INFO)
-    file_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.WARNING)  # Only warnings and above to console
-    console_format = logging.Formatter('%(levelname)s: %(message)s')
-    console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
-
-logger.info(f"Image Metadata Extractor v{__version__} initialized")
 
 # Version check
 import sys
 if sys.version_info < (3, 6):
     logger.warning("This application requires Python 3.6 or higher")
 
-# Check for required dependencies
-try:
-    import PIL
-    import exifread
-    import tkinter
-except ImportError as e:
-    logger.error(f"Required dependency not found: {e}")
-    logger.error("Please install all required dependencies using: pip install -r requirements.txt")
-
 # Application constants
-APP_NAME = "Image Metadata Extractor"
 DEFAULT_EXPORT_FORMATS = ['csv', 'json', 'txt', 'pdf']
-SUPPORTED_IMAGE_FORMATS = [
-    '.jpg', '.jpeg', '.tiff', '.tif', '.png', '.bmp', 
-    '.gif', '.webp', '.heic', '.heif', '.cr2', '.nef'
-]
 
-# Initialize subpackages
-from . import core
-from . import gui
-from . import utils
\ No newline at end of file
+# Key components and shared constants are resolved lazily on first access
+# (PEP 562) so that "import src" does not pull in PIL, exifread, hachoir or
+# the GUI tree
+_LAZY_ATTRS = {
+    'MetadataExtractor': 'src.core.metadata_extractor',
+    'FileHandler': 'src.core.file_handler',
+    'APP_NAME': 'src.core.constants',
+    'SUPPORTED_IMAGE_FORMATS': 'src.core.constants',
+}
+
+# Subpackages are not imported with the package; "src.gui" and friends are
+# imported the first time they are accessed as attributes
+_SUBPACKAGES = ('core', 'gui', 'utils')
+
+
+def __getattr__(name):
+    """Resolve key components and subpackages on first attribute access."""
+    import importlib
+
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_SUBPACKAGES))
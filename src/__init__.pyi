@@ -0,0 +1,20 @@
+from typing import Any, Dict, List
+
+from . import core as core
+from . import gui as gui
+from . import utils as utils
+from src.core.constants import APP_NAME as APP_NAME
+from src.core.constants import SUPPORTED_IMAGE_FORMATS as SUPPORTED_IMAGE_FORMATS
+from src.core.file_handler import FileHandler as FileHandler
+from src.core.metadata_extractor import MetadataExtractor as MetadataExtractor
+
+__version__: str
+__author__: str
+__email__: str
+__license__: str
+__copyright__: str
+
+package_info: Dict[str, Any]
+logger: Any
+
+DEFAULT_EXPORT_FORMATS: List[str]
@@ -5,6 +5,8 @@ This package contains the core functionality for extracting and processing
 image metadata. It provides the backend logic for the application.
 
 Modules:
+    - constants: Constants shared across the application
+    - paths: Application directory layout
     - metadata_extractor: Main class for extracting metadata from images
     - file_handler: Handles file operations and format conversions
     - gps_parser: Parses and converts GPS coordinates
@@ -14,8 +16,11 @@ Modules:
 import logging
 import os
 import sys
+import functools
 import importlib
+import importlib.util
 import platform
+from types import MappingProxyType
 
 # Setup package-level logger
 logger = logging.getLogger(__name__)
@@ -31,21 +36,6 @@ __all__ = [
     'DeviceIdentifier',
 ]
 
-# Core constants
-SUPPORTED_IMAGE_FORMATS = [
-    '.jpg', '.jpeg', '.tiff', '.tif', '.png', '.bmp', 
-    '.gif', '.webp', '.heic', '.heif', '.cr2', '.nef'
-]
-
-EXIF_DATE_FORMATS = [
-    '%Y:%m:%d %H:%M:%S',
-    '%Y-%m-%d %H:%M:%S',
-    '%Y/%m/%d %H:%M:%S',
-    '%Y:%m:%d',
-    '%Y-%m-%d',
-    '%Y/%m/%d'
-]
-
 # Check for required dependencies
 REQUIRED_PACKAGES = {
     'PIL': 'Pillow',
@@ -61,83 +51,116 @@ OPTIONAL_PACKAGES = {
     'opencv': 'opencv-python'
 }
 
-# Track available packages
-available_packages = {pkg: False for pkg in list(REQUIRED_PACKAGES.keys()) + list(OPTIONAL_PACKAGES.keys())}
-
+@functools.lru_cache(maxsize=1)
 def check_dependencies():
     """
     Check if required and optional dependencies are installed.
     
+    Availability is probed with importlib.util.find_spec, which does not
+    execute the package, and the result is cached after the first call.
+    
     Returns:
-        tuple: (all_required_available, available_packages)
+        tuple: (all_required_available, available_packages), where
+        available_packages is a read-only mapping shared by all callers
     """
     all_required_available = True
+    available_packages = {}
     
     # Check required packages
     for package, pip_name in REQUIRED_PACKAGES.items():
-        try:
-            importlib.import_module(package)
+        if importlib.util.find_spec(package) is not None:
             available_packages[package] = True
             logger.debug(f"Required package available: {package}")
-        except ImportError:
+        else:
             all_required_available = False
             available_packages[package] = False
             logger.warning(f"Required package not available: {package} (pip install {pip_name})")
     
     # Check optional packages
     for package, pip_name in OPTIONAL_PACKAGES.items():
-        try:
-            importlib.import_module(package)
+        if importlib.util.find_spec(package) is not None:
             available_packages[package] = True
             logger.debug(f"Optional package available: {package}")
-        except ImportError:
+        else:
             available_packages[package] = False
             logger.info(f"Optional package not available: {package} (pip install {pip_name})")
     
-    return all_required_available, available_packages
-
-# Check dependencies
-all_required_available, available_packages = check_dependencies()
-
-if not all_required_available:
-    missing_packages = [f"{pip_name}" for pkg, pip_name in REQUIRED_PACKAGES.items() 
-                       if not available_packages[pkg]]
-    logger.warning(f"Missing required packages: {', '.join(missing_packages)}")
-    logger.warning("Install missing packages with: pip install " + " ".join(missing_packages))
-
-# Import core components
-try:
-    from .metadata_extractor import MetadataExtractor
-    from .file_handler import FileHandler
-    from .gps_parser import GPSParser
-    from .device_identifier import DeviceIdentifier
-except ImportError as e:
-    logger.error(f"Error importing core components: {e}")
-    # Define placeholder classes if imports fail
-    
-    class MetadataExtractor:
-        """Placeholder for MetadataExtractor class."""
-        def __init__(self):
-            logger.error("MetadataExtractor module not available")
-            raise ImportError("MetadataExtractor module not available")
+    if not all_required_available:
+        missing_packages = [f"{pip_name}" for pkg, pip_name in REQUIRED_PACKAGES.items() 
+                           if not available_packages[pkg]]
+        logger.warning(f"Missing required packages: {', '.join(missing_packages)}")
+        logger.warning("Install missing packages with: pip install " + " ".join(missing_packages))
     
-    class FileHandler:
-        """Placeholder for FileHandler class."""
-        def __init__(self):
-            logger.error("FileHandler module not available")
-            raise ImportError("FileHandler module not available")
-    
-    class GPSParser:
-        """Placeholder for GPSParser class."""
-        def __init__(self):
-            logger.error("GPSParser module not available")
-            raise ImportError("GPSParser module not available")
+    return all_required_available, MappingProxyType(available_packages)
+
+def get_available_packages():
+    """
+    Get the availability of required and optional packages.
     
-    class DeviceIdentifier:
-        """Placeholder for DeviceIdentifier class."""
-        def __init__(self):
-            logger.error("DeviceIdentifier module not available")
-            raise ImportError("DeviceIdentifier module not available")
+    Returns:
+        dict: Package name mapped to availability
+    """
+    return dict(check_dependencies()[1])
+
+# Core components and constants are imported lazily on first attribute
+# access so that "import src.core" does not pull in piexif, hachoir, PIL
+# or geopy
+_SUBMOD_ATTRS = {
+    'constants': [
+        'SUPPORTED_IMAGE_FORMATS',
+        'EXIF_DATE_FORMATS',
+        'METADATA_CATEGORIES',
+        'SENSITIVE_METADATA_FIELDS',
+        'SENSITIVE_METADATA_FIELDS_LOWER',
+    ],
+    'metadata_extractor': ['MetadataExtractor'],
+    'file_handler': ['FileHandler'],
+    'gps_parser': ['GPSParser'],
+    'device_identifier': ['DeviceIdentifier'],
+}
+
+_ATTR_TO_SUBMOD = {
+    attr: submod for submod, attrs in _SUBMOD_ATTRS.items() for attr in attrs
+}
+
+
+def _make_placeholder(name):
+    """Create a placeholder class for a core component that failed to import."""
+    def __init__(self, *args, **kwargs):
+        logger.error(f"{name} module not available")
+        raise ImportError(f"{name} module not available")
+
+    return type(name, (), {
+        '__doc__': f"Placeholder for {name} class.",
+        '__init__': __init__,
+    })
+
+
+def __getattr__(name):
+    """Import core components and compute dependency state on first access."""
+    if name in _LAZY_STATE:
+        value = _LAZY_STATE[name]()
+        globals()[name] = value
+        return value
+
+    submod = _ATTR_TO_SUBMOD.get(name)
+    if submod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = importlib.import_module(f".{submod}", __name__)
+        value = getattr(module, name)
+    except ImportError as e:
+        logger.error(f"Error importing core components: {e}")
+        value = _make_placeholder(name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_ATTR_TO_SUBMOD) + list(_LAZY_STATE))
+
 
 # System information
 def get_system_info():
@@ -153,11 +176,11 @@ def get_system_info():
         'python_implementation': platform.python_implementation(),
         'system': platform.system(),
         'processor': platform.processor(),
-        'available_packages': {k: v for k, v in available_packages.items()},
+        'available_packages': get_available_packages(),
     }
     
     # Add PIL version if available
-    if available_packages.get('PIL'):
+    if check_dependencies()[1].get('PIL'):
         try:
             import PIL
             info['pil_version'] = PIL.__version__
@@ -166,56 +189,44 @@ def get_system_info():
     
     return info
 
-# Log system information
-system_info = get_system_info()
-logger.debug(f"System information: {system_info}")
-
 # Feature detection based on available packages
-FEATURES = {
-    'heic_support': available_packages.get('pyheif', False),
-    'advanced_image_analysis': available_packages.get('opencv', False),
-    'geolocation': available_packages.get('geopy', False),
-    'mapping': available_packages.get('folium', False),
-}
-
-logger.debug(f"Available features: {FEATURES}")
-
-# Metadata categories
-METADATA_CATEGORIES = {
-    'basic': 'Basic Information',
-    'exif': 'EXIF Data',
-    'gps': 'GPS Location',
-    'device': 'Device Information',
-    'file': 'File Information',
-    'iptc': 'IPTC Data',
-    'xmp': 'XMP Data',
-    'icc': 'ICC Profile',
-    'makernotes': 'Maker Notes',
-}
-
-# Sensitive metadata fields that might contain personal information
-SENSITIVE_METADATA_FIELDS = [
-    'GPS', 'Location', 'Latitude', 'Longitude',
-    'SerialNumber', 'CameraSerialNumber', 'BodySerialNumber',
-    'LensSerialNumber', 'InternalSerialNumber',
-    'Owner', 'OwnerName', 'CameraOwner',
-    'Artist', 'Author', 'Copyright',
-    'Email', 'Address', 'Phone',
-    'UserComment', 'Comment',
-    'Software', 'HostComputer',
-]
+def get_features():
+    """
+    Get the optional features enabled by the installed packages.
+    
+    Returns:
+        dict: Feature name mapped to availability
+    """
+    available_packages = check_dependencies()[1]
+    features = {
+        'heic_support': available_packages.get('pyheif', False),
+        'advanced_image_analysis': available_packages.get('opencv', False),
+        'geolocation': available_packages.get('geopy', False),
+        'mapping': available_packages.get('folium', False),
+    }
+    
+    logger.debug(f"Available features: {features}")
+    return features
 
 # Initialize core components
 def initialize_core():
     """Initialize core components and return status."""
+    all_required_available, available_packages = check_dependencies()
     status = {
         'all_dependencies_available': all_required_available,
-        'available_packages': available_packages,
-        'features': FEATURES,
+        'available_packages': dict(available_packages),
+        'features': get_features(),
     }
     
     logger.info("Core package initialized")
     return status
 
-# Initialize when imported
-core_status = initialize_core()
\ No newline at end of file
+# Dependency state that used to be computed at import time is now
+# computed when first read, e.g. src.core.FEATURES
+_LAZY_STATE = {
+    'all_required_available': lambda: check_dependencies()[0],
+    'available_packages': get_available_packages,
+    'system_info': get_system_info,
+    'FEATURES': get_features,
+    'core_status': initialize_core,
+}
@@ -0,0 +1,29 @@
+from typing import Any, Dict, List
+
+from .constants import EXIF_DATE_FORMATS as EXIF_DATE_FORMATS
+from .constants import METADATA_CATEGORIES as METADATA_CATEGORIES
+from .constants import SENSITIVE_METADATA_FIELDS as SENSITIVE_METADATA_FIELDS
+from .constants import SENSITIVE_METADATA_FIELDS_LOWER as SENSITIVE_METADATA_FIELDS_LOWER
+from .constants import SUPPORTED_IMAGE_FORMATS as SUPPORTED_IMAGE_FORMATS
+from .device_identifier import DeviceIdentifier as DeviceIdentifier
+from .file_handler import FileHandler as FileHandler
+from .gps_parser import GPSParser as GPSParser
+from .metadata_extractor import MetadataExtractor as MetadataExtractor
+
+__version__: str
+__all__: List[str]
+
+REQUIRED_PACKAGES: Dict[str, str]
+OPTIONAL_PACKAGES: Dict[str, str]
+
+available_packages: Dict[str, bool]
+all_required_available: bool
+system_info: Dict[str, Any]
+FEATURES: Dict[str, bool]
+core_status: Dict[str, Any]
+
+def check_dependencies() -> tuple: ...
+def get_available_packages() -> Dict[str, bool]: ...
+def get_features() -> Dict[str, bool]: ...
+def get_system_info() -> Dict[str, Any]: ...
+def initialize_core() -> Dict[str, Any]: ...
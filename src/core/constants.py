@@ -0,0 +1,116 @@
+"""
+Constants Module
+
+This module holds the constants shared across the application. They are
+re-exported lazily from the src and src.core packages.
+"""
+
+import re
+import functools
+from typing import Callable
+
+# Application name
+APP_NAME = "Image Metadata Extractor"
+
+# Supported image file extensions (lowercase)
+SUPPORTED_IMAGE_FORMATS = frozenset({
+    '.jpg', '.jpeg', '.tiff', '.tif', '.png', '.bmp', 
+    '.gif', '.webp', '.heic', '.heif', '.cr2', '.nef'
+})
+
+EXIF_DATE_FORMATS = [
+    '%Y:%m:%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d %H:%M:%S',
+    '%Y:%m:%d',
+    '%Y-%m-%d',
+    '%Y/%m/%d'
+]
+
+# Metadata categories
+METADATA_CATEGORIES = {
+    'basic': 'Basic Information',
+    'exif': 'EXIF Data',
+    'gps': 'GPS Location',
+    'device': 'Device Information',
+    'file': 'File Information',
+    'iptc': 'IPTC Data',
+    'xmp': 'XMP Data',
+    'icc': 'ICC Profile',
+    'makernotes': 'Maker Notes',
+}
+
+# Sensitive metadata fields that might contain personal information
+SENSITIVE_METADATA_FIELDS = [
+    'GPS', 'Location', 'Latitude', 'Longitude',
+    'SerialNumber', 'CameraSerialNumber', 'BodySerialNumber',
+    'LensSerialNumber', 'InternalSerialNumber',
+    'Owner', 'OwnerName', 'CameraOwner',
+    'Artist', 'Author', 'Copyright',
+    'Email', 'Address', 'Phone',
+    'UserComment', 'Comment',
+    'Software', 'HostComputer',
+]
+
+# Lowercased form of SENSITIVE_METADATA_FIELDS for case-insensitive checks
+SENSITIVE_METADATA_FIELDS_LOWER = frozenset(field.lower() for field in SENSITIVE_METADATA_FIELDS)
+
+# Report category of well-known metadata keys
+METADATA_KEY_CATEGORIES = {
+    **dict.fromkeys(('ImageWidth', 'ImageHeight', 'ImageSize', 'Megapixels', 'AspectRatio',
+                     'ColorSpace', 'BitsPerPixel'), 'Basic Information'),
+    **dict.fromkeys(('Make', 'Model', 'DeviceMake', 'DeviceModel', 'DeviceType', 'Software',
+                     'CameraSerialNumber', 'DeviceSerialNumber'), 'Camera Information'),
+    **dict.fromkeys(('FocalLength', 'FocalLength35mm'), 'Lens Information'),
+    **dict.fromkeys(('Aperture', 'ShutterSpeed', 'ISO', 'ExposureTime', 'ExposureProgram',
+                     'ExposureMode', 'ExposureCompensation', 'MeteringMode', 'Flash',
+                     'WhiteBalance'), 'Exposure Information'),
+    **dict.fromkeys(('Latitude', 'Longitude', 'Altitude', 'Location', 'LocationName', 'City',
+                     'State', 'Country'), 'GPS Information'),
+}
+
+# Report category of keys matched by a prefix pattern; the group of the
+# pattern that matched indexes this tuple
+METADATA_PREFIX_CATEGORIES = ('GPS Information', 'EXIF Data', 'IPTC Data', 'XMP Data')
+
+# Order of the categories in reports
+METADATA_CATEGORY_ORDER = (
+    'Basic Information', 'Camera Information', 'Lens Information', 'Exposure Information',
+    'GPS Information', 'EXIF Data', 'IPTC Data', 'XMP Data', 'File Information', 'Other Metadata',
+)
+
+
+def make_metadata_categorizer(prefix_pattern: str) -> Callable[[str], str]:
+    """
+    Create a function that gets the report category of a metadata key.
+    
+    Args:
+        prefix_pattern: Regular expression with one group per entry of
+            METADATA_PREFIX_CATEGORIES, matched at the start of a key that
+            has no fixed category
+        
+    Returns:
+        Cached function mapping a metadata key to its category name
+    """
+    prefix_match = re.compile(prefix_pattern).match
+    
+    @functools.lru_cache(maxsize=4096)
+    def metadata_category(key: str) -> str:
+        """Get the report category of a metadata key."""
+        if key.startswith('File'):
+            return 'File Information'
+        
+        category = METADATA_KEY_CATEGORIES.get(key)
+        if category is not None:
+            return category
+        
+        if 'Lens' in key:
+            return 'Lens Information'
+        
+        match = prefix_match(key)
+        if match is not None:
+            return METADATA_PREFIX_CATEGORIES[match.lastindex - 1]
+        
+        return 'Other Metadata'
+    
+    return metadata_category
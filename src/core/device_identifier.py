@@ -9,12 +9,799 @@ import logging
 import re
 import json
 import os
-from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime
+import functools
+import heapq
+import sqlite3
+import threading
+import weakref
+from collections import defaultdict
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Pattern, Tuple
 
 # Get the package logger
 logger = logging.getLogger(__name__)
 
+# Try to import optional fuzzy matching library
+try:
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    logger.info("rapidfuzz library not available. Fuzzy device matching will be slower.")
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    logger.info("orjson library not available. Device database will load more slowly.")
+    ORJSON_AVAILABLE = False
+
+# Device database locations, in the order they are tried
+DEVICE_DB_PATHS = (
+    os.path.join(os.path.dirname(__file__), 'data', 'device_database.json'),
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'device_database.json'),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'device_database.json'),
+)
+
+# Suggested location for fuzzy lookup results persisted between runs; an
+# identifier only persists lookups when it is given a cache file
+DEVICE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "image_extractor", "device_cache.sqlite3")
+
+# Number of persisted lookups written before they are committed
+DEVICE_CACHE_COMMIT_INTERVAL = 64
+
+# Whitespace runs collapsed by _clean_device_string
+_WS_RE = re.compile(r'\s+')
+
+# Dotted version number in an OS version string, e.g. '14.2.1'
+_OS_VERSION_RE = re.compile(r'(\d+(?:\.\d+)*)')
+
+# Dotted version number in a software name, e.g. 'Photoshop 24.1'
+_SOFTWARE_VERSION_RE = re.compile(r'(\d+(?:\.\d+)+)')
+
+# Four-digit year in a release date
+_YEAR_RE = re.compile(r'(\d{4})')
+
+# ASCII control characters (except tab) removed by _clean_device_string,
+# as a str.translate table and as a bytes.translate deletion set
+_CTRL_TBL = dict.fromkeys([i for i in range(32) if i != 9], None)
+_CTRL_BYTES = bytes(i for i in range(32) if i != 9)
+
+# Metadata keys checked for each device field, in priority order
+MAKE_KEYS = (
+    'Make', 'make', 'EXIF:Make', 'IFD0:Make', 'Image Make',
+    'Manufacturer', 'CameraManufacturer', 'DeviceManufacturer',
+    'EXIF:Manufacturer', 'XMP:Manufacturer', 'IPTC:Manufacturer'
+)
+
+MODEL_KEYS = (
+    'Model', 'model', 'EXIF:Model', 'IFD0:Model', 'Image Model',
+    'CameraModel', 'DeviceModel', 'EXIF:CameraModel',
+    'XMP:Model', 'IPTC:Model'
+)
+
+SOFTWARE_KEYS = (
+    'Software', 'software', 'EXIF:Software', 'IFD0:Software', 'Image Software',
+    'ProcessingSoftware', 'CreatorTool', 'XMP:CreatorTool', 'XMP:Software',
+    'IPTC:ProcessingSoftware'
+)
+
+LENS_MODEL_KEYS = (
+    'LensModel', 'Lens', 'EXIF:LensModel', 'MakerNotes:LensModel',
+    'XMP:LensModel', 'Lens Model', 'Lens Info', 'LensInfo'
+)
+
+LENS_MAKE_KEYS = (
+    'LensMake', 'EXIF:LensMake', 'MakerNotes:LensMake',
+    'XMP:LensMake', 'Lens Make'
+)
+
+LENS_SERIAL_KEYS = (
+    'LensSerialNumber', 'EXIF:LensSerialNumber', 'MakerNotes:LensSerialNumber',
+    'XMP:LensSerialNumber', 'Lens Serial Number'
+)
+
+LENS_SPEC_KEYS = (
+    'LensSpecification', 'EXIF:LensSpecification', 'MakerNotes:LensSpecification',
+    'XMP:LensSpecification', 'Lens Specification'
+)
+
+SERIAL_KEYS = (
+    'SerialNumber', 'CameraSerialNumber', 'BodySerialNumber',
+    'EXIF:SerialNumber', 'MakerNotes:SerialNumber',
+    'XMP:SerialNumber', 'Camera Serial Number'
+)
+
+FIRMWARE_KEYS = (
+    'FirmwareVersion', 'Firmware', 'EXIF:FirmwareVersion',
+    'MakerNotes:FirmwareVersion', 'XMP:FirmwareVersion'
+)
+
+OWNER_KEYS = (
+    'OwnerName', 'CameraOwnerName', 'EXIF:OwnerName',
+    'MakerNotes:OwnerName', 'XMP:OwnerName', 'Owner'
+)
+
+MODE_KEYS = (
+    'ExposureMode', 'ExposureProgram', 'SceneCaptureType',
+    'EXIF:ExposureMode', 'EXIF:ExposureProgram', 'EXIF:SceneCaptureType',
+    'MakerNotes:ExposureMode', 'XMP:ExposureMode'
+)
+
+OS_KEYS = (
+    'OSVersion', 'OperatingSystem', 'Software',
+    'XMP:OSVersion', 'XMP:OperatingSystem'
+)
+
+# Device fields and the metadata keys that supply them, in priority order
+DEVICE_FIELD_KEYS = (
+    ('make', MAKE_KEYS),
+    ('model', MODEL_KEYS),
+    ('software', SOFTWARE_KEYS),
+    ('lens_model', LENS_MODEL_KEYS),
+    ('lens_make', LENS_MAKE_KEYS),
+    ('lens_serial', LENS_SERIAL_KEYS),
+    ('lens_spec', LENS_SPEC_KEYS),
+    ('serial', SERIAL_KEYS),
+    ('firmware', FIRMWARE_KEYS),
+    ('owner', OWNER_KEYS),
+    ('mode', MODE_KEYS),
+    ('os', OS_KEYS),
+)
+
+# Metadata key -> ((field, priority), ...); a key such as 'Software' can
+# supply more than one field
+_KEY_MAP = defaultdict(list)
+for _field, _keys in DEVICE_FIELD_KEYS:
+    for _priority, _key in enumerate(_keys):
+        _KEY_MAP[_key].append((_field, _priority))
+_KEY_MAP = {key: tuple(targets) for key, targets in _KEY_MAP.items()}
+del _field, _keys, _priority, _key
+
+# EXIF ExposureProgram values
+EXPOSURE_PROGRAMS = {
+    0: 'Not Defined',
+    1: 'Manual',
+    2: 'Program AE',
+    3: 'Aperture Priority',
+    4: 'Shutter Priority',
+    5: 'Creative (Slow Speed)',
+    6: 'Action (High Speed)',
+    7: 'Portrait',
+    8: 'Landscape',
+    9: 'Bulb'
+}
+
+# EXIF SceneCaptureType values
+SCENE_CAPTURE_TYPES = {
+    0: 'Standard',
+    1: 'Landscape',
+    2: 'Portrait',
+    3: 'Night',
+    4: 'Night Portrait',
+    5: 'Backlight',
+    6: 'Backlight Portrait',
+    7: 'Macro',
+    8: 'Sports',
+    9: 'Action',
+    10: 'Fireworks',
+    11: 'Children',
+    12: 'Pets'
+}
+
+# EXIF Flash values
+FLASH_DESCRIPTIONS = MappingProxyType({
+    0: "No Flash",
+    1: "Flash Fired",
+    5: "Flash Fired, Return not detected",
+    7: "Flash Fired, Return detected",
+    8: "On, Flash did not fire",
+    9: "Flash Fired, Compulsory mode",
+    13: "Flash Fired, Compulsory mode, Return not detected",
+    15: "Flash Fired, Compulsory mode, Return detected",
+    16: "Off, Flash did not fire",
+    24: "Off, Flash did not fire, Return not detected",
+    25: "Flash Fired, Auto mode",
+    29: "Flash Fired, Auto mode, Return not detected",
+    31: "Flash Fired, Auto mode, Return detected",
+    32: "No flash function",
+    65: "Flash Fired, Red-eye reduction",
+    69: "Flash Fired, Red-eye reduction, Return not detected",
+    71: "Flash Fired, Red-eye reduction, Return detected",
+    73: "Flash Fired, Compulsory mode, Red-eye reduction",
+    77: "Flash Fired, Compulsory mode, Red-eye reduction, Return not detected",
+    79: "Flash Fired, Compulsory mode, Red-eye reduction, Return detected",
+    89: "Flash Fired, Auto mode, Red-eye reduction",
+    93: "Flash Fired, Auto mode, Red-eye reduction, Return not detected",
+    95: "Flash Fired, Auto mode, Red-eye reduction, Return detected"
+})
+
+# EXIF MeteringMode values
+METERING_MODES = MappingProxyType({
+    0: "Unknown",
+    1: "Average",
+    2: "Center-weighted average",
+    3: "Spot",
+    4: "Multi-spot",
+    5: "Pattern",
+    6: "Partial",
+    255: "Other"
+})
+
+# EXIF WhiteBalance values
+WHITE_BALANCE_MODES = MappingProxyType({
+    0: "Auto",
+    1: "Manual"
+})
+
+# Camera settings to extract, mapped to their output names
+CAMERA_SETTING_KEYS = MappingProxyType({
+    'FNumber': 'Aperture',
+    'ApertureValue': 'Aperture',
+    'FocalLength': 'FocalLength',
+    'FocalLengthIn35mmFormat': 'FocalLength35mm',
+    'ExposureTime': 'ExposureTime',
+    'ShutterSpeedValue': 'ShutterSpeed',
+    'ISOSpeedRatings': 'ISO',
+    'ISO': 'ISO',
+    'WhiteBalance': 'WhiteBalance',
+    'MeteringMode': 'MeteringMode',
+    'ExposureProgram': 'ExposureProgram',
+    'ExposureMode': 'ExposureMode',
+    'ExposureCompensation': 'ExposureCompensation',
+    'Flash': 'Flash',
+    'FlashMode': 'FlashMode',
+    'FocusMode': 'FocusMode',
+    'DigitalZoomRatio': 'DigitalZoom'
+})
+
+# Key variations a camera setting may appear under, in priority order
+CAMERA_SETTING_KEY_FORMATS = ('{}', 'EXIF:{}', 'MakerNotes:{}', 'XMP:{}', 'Image {}')
+
+# Metadata key -> (camera setting, priority) for a single pass over the metadata
+_CAMERA_SETTING_KEY_MAP = {
+    key_format.format(exif_key): (exif_key, priority)
+    for exif_key in CAMERA_SETTING_KEYS
+    for priority, key_format in enumerate(CAMERA_SETTING_KEY_FORMATS)
+}
+
+# Value names for the shooting mode keys that hold numeric EXIF codes
+MODE_VALUE_NAMES = {}
+for _key in MODE_KEYS:
+    if _key.endswith('ExposureProgram'):
+        MODE_VALUE_NAMES[_key] = EXPOSURE_PROGRAMS
+    elif _key.endswith('SceneCaptureType'):
+        MODE_VALUE_NAMES[_key] = SCENE_CAPTURE_TYPES
+del _key
+
+# Common camera manufacturers, keyed by lowercased name prefix (read-only)
+KNOWN_MANUFACTURERS = MappingProxyType({
+    # Mobile phone manufacturers
+    'apple': 'Apple',
+    'samsung': 'Samsung',
+    'huawei': 'Huawei',
+    'xiaomi': 'Xiaomi',
+    'google': 'Google',
+    'oneplus': 'OnePlus',
+    'oppo': 'OPPO',
+    'vivo': 'Vivo',
+    'motorola': 'Motorola',
+    'lg': 'LG',
+    'sony': 'Sony',
+    'htc': 'HTC',
+    'nokia': 'Nokia',
+    'asus': 'ASUS',
+    'lenovo': 'Lenovo',
+    'zte': 'ZTE',
+    
+    # Camera manufacturers
+    'canon': 'Canon',
+    'nikon': 'Nikon',
+    'sony': 'Sony',
+    'fuji': 'Fujifilm',
+    'fujifilm': 'Fujifilm',
+    'olympus': 'Olympus',
+    'panasonic': 'Panasonic',
+    'pentax': 'Pentax',
+    'leica': 'Leica',
+    'hasselblad': 'Hasselblad',
+    'kodak': 'Kodak',
+    'sigma': 'Sigma',
+    'ricoh': 'Ricoh',
+    'gopro': 'GoPro',
+    'dji': 'DJI',
+})
+
+# Common software that processes images, keyed by lowercased name (read-only)
+KNOWN_SOFTWARE = MappingProxyType({
+    'photoshop': 'Adobe Photoshop',
+    'lightroom': 'Adobe Lightroom',
+    'gimp': 'GIMP',
+    'affinity': 'Affinity Photo',
+    'capture one': 'Capture One',
+    'luminar': 'Luminar',
+    'snapseed': 'Snapseed',
+    'instagram': 'Instagram',
+    'vsco': 'VSCO',
+    'pixlr': 'Pixlr',
+    'paintshop': 'PaintShop Pro',
+    'photolab': 'DxO PhotoLab',
+    'acdsee': 'ACDSee',
+    'aperture': 'Apple Aperture',
+    'photos': 'Apple Photos',
+    'picasa': 'Google Picasa',
+    'darktable': 'Darktable',
+    'rawtherapee': 'RawTherapee',
+    'pixelmator': 'Pixelmator',
+})
+
+# Device database fields and the output fields they are reported as
+DB_FIELD_MAPPING = MappingProxyType({
+    'make': 'Manufacturer',
+    'model': 'FullModel',
+    'release_date': 'ReleaseDate',
+    'sensor_type': 'SensorType',
+    'sensor_size': 'SensorSize',
+    'megapixels': 'Megapixels',
+    'max_resolution': 'MaxResolution',
+    'lens_mount': 'LensMount',
+    'screen_size': 'ScreenSize',
+    'os': 'OperatingSystem',
+    'cpu': 'Processor',
+    'storage': 'Storage',
+    'battery': 'Battery',
+    'weight': 'Weight',
+    'dimensions': 'Dimensions',
+    'price': 'Price',
+    'url': 'ProductURL'
+})
+
+# Minimum rapidfuzz WRatio score for a fuzzy search suggestion
+SEARCH_FUZZY_SCORE_CUTOFF = 75
+
+# Device type filters accepted by search_device_database
+SEARCH_CATEGORIES = MappingProxyType({
+    'camera': 'cameras',
+    'digital camera': 'cameras',
+    'smartphone': 'phones',
+    'phone': 'phones',
+    'mobile': 'phones',
+    'lens': 'lenses',
+    'camera lens': 'lenses',
+    'software': 'software',
+    'app': 'software',
+    'application': 'software',
+})
+
+# Device type reported for each database category
+CATEGORY_DEVICE_TYPES = MappingProxyType({
+    'cameras': 'Camera',
+    'phones': 'Smartphone',
+    'lenses': 'Camera Lens',
+    'software': 'Software',
+})
+
+# Common lens manufacturers, keyed by lowercased name or mount prefix
+LENS_MANUFACTURERS = {
+    'canon': 'Canon',
+    'ef-s': 'Canon',
+    'ef-m': 'Canon',
+    'ef': 'Canon',
+    'rf': 'Canon',
+    'nikkor': 'Nikon',
+    'nikon': 'Nikon',
+    'sony': 'Sony',
+    'zeiss': 'Zeiss',
+    'leica': 'Leica',
+    'sigma': 'Sigma',
+    'tamron': 'Tamron',
+    'tokina': 'Tokina',
+    'samyang': 'Samyang',
+    'rokinon': 'Rokinon',
+    'voigtlander': 'Voigtlander',
+    'olympus': 'Olympus',
+    'zuiko': 'Olympus',
+    'panasonic': 'Panasonic',
+    'lumix': 'Panasonic',
+    'fuji': 'Fujifilm',
+    'fujinon': 'Fujifilm',
+    'fujifilm': 'Fujifilm',
+    'pentax': 'Pentax',
+    'hasselblad': 'Hasselblad',
+    'schneider': 'Schneider',
+    'mamiya': 'Mamiya',
+    'meyer': 'Meyer-Optik',
+    'laowa': 'Laowa',
+    'venus': 'Venus Optics',
+    'irix': 'Irix',
+    'ttartisan': 'TTArtisan',
+    '7artisans': '7Artisans'
+}
+
+# Substrings of the make (or model) that identify each kind of device
+SMARTPHONE_MANUFACTURERS = (
+    'apple', 'iphone', 'samsung', 'huawei', 'xiaomi', 'google', 'pixel',
+    'oneplus', 'oppo', 'vivo', 'motorola', 'lg', 'htc', 'nokia', 'asus',
+    'lenovo', 'zte', 'realme', 'honor', 'poco'
+)
+
+TABLET_INDICATORS = ('ipad', 'tab', 'tablet', 'pad', 'galaxy tab')
+
+CAMERA_MANUFACTURERS = (
+    'canon', 'nikon', 'sony', 'fuji', 'fujifilm', 'olympus', 'panasonic',
+    'pentax', 'leica', 'hasselblad', 'kodak', 'sigma', 'ricoh'
+)
+
+DRONE_MANUFACTURERS = ('dji', 'parrot', 'autel', 'skydio', 'yuneec')
+
+ACTION_CAMERA_INDICATORS = ('gopro', 'hero', 'action', 'insta360')
+
+# Metadata keys whose presence suggests a dedicated camera
+LENS_INDICATOR_KEYS = ('Lens', 'LensModel', 'LensInfo', 'LensSerialNumber')
+
+# Every metadata key that identify_device reads; images that agree on these
+# get the same result
+_DEVICE_METADATA_KEYS = frozenset(_KEY_MAP).union(
+    ('DeviceType', 'FocalLength', 'FNumber', 'ISO', 'ExposureTime'),
+    LENS_INDICATOR_KEYS,
+)
+
+
+# Metadata keys holding privacy-sensitive data, by sensitive field
+PRIVACY_KEYS = (
+    ('GPS Location', ('GPS:GPSLatitude', 'GPS:GPSLongitude', 'GPSLatitude', 'GPSLongitude', 'Latitude', 'Longitude')),
+    ('Serial Number', ('SerialNumber', 'CameraSerialNumber', 'BodySerialNumber', 'LensSerialNumber')),
+    ('Owner/Author Information', ('OwnerName', 'CameraOwnerName', 'Artist', 'Author', 'Creator', 'By-line')),
+    ('Device Identifier', ()),
+    ('Timestamp', ('DateTimeOriginal', 'CreateDate', 'ModifyDate', 'DateCreated')),
+    ('Software Information', ('Software', 'ProcessingSoftware', 'CreatorTool')),
+)
+
+# Sensitive fields in reporting order
+PRIVACY_FIELDS = tuple(field for field, _ in PRIVACY_KEYS)
+
+# Metadata key -> sensitive field
+PRIVACY_FIELD_KEYS = MappingProxyType({
+    key: field for field, keys in PRIVACY_KEYS for key in keys
+})
+
+# Substrings marking a unique device identifier key on phones and tablets
+DEVICE_ID_KEY_PARTS = ('DeviceID', 'UniqueID', 'IMEI', 'UUID')
+
+
+def _compile_alternation(words: Tuple[str, ...]) -> Pattern:
+    """Compile a regex matching any of the given literal substrings."""
+    return re.compile('|'.join(map(re.escape, words)))
+
+
+# One compiled scan per category instead of a substring test per entry
+_SMARTPHONE_RE = _compile_alternation(SMARTPHONE_MANUFACTURERS)
+_TABLET_RE = _compile_alternation(TABLET_INDICATORS)
+_CAMERA_RE = _compile_alternation(CAMERA_MANUFACTURERS)
+_DRONE_RE = _compile_alternation(DRONE_MANUFACTURERS)
+_ACTION_CAMERA_RE = _compile_alternation(ACTION_CAMERA_INDICATORS)
+_PHONE_MODEL_RE = _compile_alternation(('phone', 'smartphone'))
+_CAMERA_MODEL_RE = _compile_alternation(('camera', 'dslr', 'mirrorless'))
+_DEVICE_ID_KEY_RE = _compile_alternation(DEVICE_ID_KEY_PARTS)
+
+# Anchored with match(); alternatives are tried in KNOWN_MANUFACTURERS order,
+# so the first listed prefix of a make wins
+_MANUFACTURER_PREFIX_RE = _compile_alternation(tuple(KNOWN_MANUFACTURERS))
+
+# Lens manufacturer keys as one alternation, longest first so that e.g.
+# 'ef-s' is preferred over 'ef'; ties are resolved by LENS_MANUFACTURERS order
+_LENS_KEYS_PATTERN = '|'.join(
+    map(re.escape, sorted(LENS_MANUFACTURERS, key=len, reverse=True))
+)
+_LENS_PREFIX_RE = re.compile(_LENS_KEYS_PATTERN)
+_LENS_WORD_RE = re.compile(r'\b(?:' + _LENS_KEYS_PATTERN + r')\b')
+_LENS_KEY_RANK = {key: rank for rank, key in enumerate(LENS_MANUFACTURERS)}
+
+
+def _find_device_db_path() -> Optional[str]:
+    """Get the path of the first device database file that exists."""
+    for path in DEVICE_DB_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _device_db_signature() -> Optional[str]:
+    """
+    Identify the current version of the device database file.
+    
+    Returns:
+        Path, modification time and size of the file, or None if there is no
+        database file
+    """
+    path = _find_device_db_path()
+    if path is None:
+        return None
+    
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    
+    return f"{path}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _close_device_cache(conn: sqlite3.Connection) -> None:
+    """Commit pending lookups and close a persistent lookup cache connection."""
+    try:
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.debug(f"Could not save device lookup cache: {e}")
+    finally:
+        conn.close()
+
+
+def _write_device_db(path: str, device_db: Dict[str, Any]) -> None:
+    """
+    Write the device database to a JSON file.
+    
+    The file is written to a temporary file next to the target and then
+    moved into place, so an interrupted save never leaves a truncated
+    database behind.
+    
+    Args:
+        path: Path of the database file
+        device_db: Device database to write
+    """
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(device_db, option=orjson.OPT_INDENT_2)
+    else:
+        # Keep non-ASCII names as UTF-8 instead of \uXXXX escapes
+        data = json.dumps(device_db, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _levenshtein_distance(s1: str, s2: str) -> int:
+    """
+    Calculate the Levenshtein edit distance between two strings.
+    
+    Used when rapidfuzz is not installed; keeps only two rows of the
+    dynamic programming table.
+    
+    Args:
+        s1: First string
+        s2: Second string
+        
+    Returns:
+        Minimum number of insertions, deletions and substitutions
+    """
+    # Iterate over the shorter string in the inner loop
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current = [i]
+        for j, c2 in enumerate(s2, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (c1 != c2),
+            ))
+        previous = current
+    
+    return previous[-1]
+
+
+def _release_year(release_date: Any) -> Optional[int]:
+    """
+    Get the release year of a database entry.
+    
+    Args:
+        release_date: Release date from the database, if any
+        
+    Returns:
+        Four-digit year found in a release date string, or None
+    """
+    if release_date and isinstance(release_date, str):
+        year_match = _YEAR_RE.search(release_date)
+        if year_match:
+            return int(year_match.group(1))
+    return None
+
+
+def _exif_code(value: Any) -> Optional[int]:
+    """
+    Get the integer code of an EXIF setting value.
+    
+    Args:
+        value: Setting value, e.g. 16 or '16'
+        
+    Returns:
+        Integer code, or None if the value is not an integer or a digit string
+    """
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+
+def _trigrams(text: str) -> set:
+    """Get the set of three-character substrings of a string."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _device_signature(metadata: Dict[str, Any]) -> Optional[frozenset]:
+    """
+    Get a hashable summary of the metadata that identify_device reads.
+    
+    Args:
+        metadata: Dictionary containing image metadata
+        
+    Returns:
+        Frozen set of the relevant (key, type, value) triples, or None if a
+        value is not hashable
+    """
+    items = []
+    for key in _DEVICE_METADATA_KEYS & metadata.keys():
+        value = metadata[key]
+        if isinstance(value, list):
+            value = tuple(value)
+        # Keep the type, since e.g. 1 and True compare equal but format differently
+        items.append((key, type(metadata[key]), value))
+    
+    try:
+        return frozenset(items)
+    except TypeError:
+        return None
+
+
+def _scan_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Find the value of every device field in a single pass over the metadata.
+    
+    Each field takes the value of its highest-priority key that has a
+    non-empty value. The 'mode' field accepts any value other than None and
+    is returned as a (key, value) pair, since numeric modes are decoded
+    according to the key they came from.
+    
+    Args:
+        metadata: Dictionary containing image metadata
+        
+    Returns:
+        Dictionary mapping field name to value
+    """
+    found = {}
+    
+    for key in _KEY_MAP.keys() & metadata.keys():
+        value = metadata[key]
+        
+        for field, priority in _KEY_MAP[key]:
+            # A shooting mode of 0 is meaningful; other fields must be non-empty
+            present = value is not None if field == 'mode' else bool(value)
+            if not present:
+                continue
+            
+            current = found.get(field)
+            if current is None or priority < current[0]:
+                found[field] = (priority, key, value)
+    
+    fields = {field: value for field, (_, _, value) in found.items()}
+    if 'mode' in found:
+        fields['mode'] = found['mode'][1:]
+    
+    return fields
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_manufacturer_name(make: str) -> str:
+    """
+    Normalize a manufacturer name, memoized per distinct make.
+    
+    Args:
+        make: Manufacturer name
+        
+    Returns:
+        Normalized manufacturer name, or make itself if it is not known
+    """
+    match = _MANUFACTURER_PREFIX_RE.match(make.lower())
+    if match:
+        return KNOWN_MANUFACTURERS[match.group()]
+    
+    return make
+
+
+@functools.lru_cache(maxsize=4096)
+def _lens_make_from_model(lens_model_lower: str) -> Optional[str]:
+    """
+    Find the lens manufacturer named in a lowercased lens model string.
+    
+    Args:
+        lens_model_lower: Lowercased lens model string
+        
+    Returns:
+        Lens manufacturer or None if not found
+    """
+    # Keys the model starts with, or contains as a whole word
+    matched = [match.group() for match in _LENS_WORD_RE.finditer(lens_model_lower)]
+    prefix = _LENS_PREFIX_RE.match(lens_model_lower)
+    if prefix:
+        matched.append(prefix.group())
+    
+    if not matched:
+        return None
+    
+    # The earliest entry in LENS_MANUFACTURERS wins
+    return LENS_MANUFACTURERS[min(matched, key=_LENS_KEY_RANK.__getitem__)]
+
+
+# Keys that identify_device can report, in output order
+DEVICE_INFO_FIELDS = (
+    'DeviceMake', 'DeviceModel', 'Software', 'DeviceType',
+    # Lens details (cameras only)
+    'LensModel', 'LensMake', 'LensSerialNumber', 'MinFocalLength',
+    'MaxFocalLength', 'MinAperture', 'MaxAperture', 'LensSpecification', 'Lens',
+    # Additional device details
+    'DeviceSerialNumber', 'FirmwareVersion', 'OwnerName', 'ShootingMode',
+    'OperatingSystem', 'OSVersion',
+    # Device database details
+    'Manufacturer', 'FullModel', 'ReleaseDate', 'SensorType', 'SensorSize',
+    'Megapixels', 'MaxResolution', 'LensMount', 'ScreenSize', 'Processor',
+    'Storage', 'Battery', 'Weight', 'Dimensions', 'Price', 'ProductURL',
+    'DeviceName',
+)
+
+
+class DeviceInfo:
+    """
+    Fixed-layout record of the device details found by identify_device.
+    
+    Attributes are named after the reported keys. Unset attributes are None
+    and are left out of the dictionary returned by to_dict().
+    """
+    
+    __slots__ = DEVICE_INFO_FIELDS
+    
+    def __init__(self):
+        """Initialize an empty record."""
+        for field in DEVICE_INFO_FIELDS:
+            setattr(self, field, None)
+    
+    def update(self, values: Dict[str, Any], overwrite: bool = True) -> None:
+        """
+        Set fields from a dictionary of reported keys.
+        
+        Args:
+            values: Field values keyed by field name
+            overwrite: Whether to replace fields that are already set
+        """
+        for field, value in values.items():
+            if overwrite or getattr(self, field) is None:
+                setattr(self, field, value)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to the dictionary returned by identify_device.
+        
+        Returns:
+            Dictionary of the fields that are set
+        """
+        result = {}
+        for field in DEVICE_INFO_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = value
+        return result
+
 
 class DeviceIdentifier:
     """
@@ -24,75 +811,45 @@ class DeviceIdentifier:
     identify specific camera models, and provide additional device details.
     """
     
-    def __init__(self):
-        """Initialize the DeviceIdentifier."""
-        # Load device database
-        self.device_db = self._load_device_database()
-        
-        # Common camera manufacturers
-        self.known_manufacturers = {
-            # Mobile phone manufacturers
-            'apple': 'Apple',
-            'samsung': 'Samsung',
-            'huawei': 'Huawei',
-            'xiaomi': 'Xiaomi',
-            'google': 'Google',
-            'oneplus': 'OnePlus',
-            'oppo': 'OPPO',
-            'vivo': 'Vivo',
-            'motorola': 'Motorola',
-            'lg': 'LG',
-            'sony': 'Sony',
-            'htc': 'HTC',
-            'nokia': 'Nokia',
-            'asus': 'ASUS',
-            'lenovo': 'Lenovo',
-            'zte': 'ZTE',
-            
-            # Camera manufacturers
-            'canon': 'Canon',
-            'nikon': 'Nikon',
-            'sony': 'Sony',
-            'fuji': 'Fujifilm',
-            'fujifilm': 'Fujifilm',
-            'olympus': 'Olympus',
-            'panasonic': 'Panasonic',
-            'pentax': 'Pentax',
-            'leica': 'Leica',
-            'hasselblad': 'Hasselblad',
-            'kodak': 'Kodak',
-            'sigma': 'Sigma',
-            'ricoh': 'Ricoh',
-            'gopro': 'GoPro',
-            'dji': 'DJI',
-        }
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Initialize the DeviceIdentifier.
         
-        # Common software that processes images
-        self.known_software = {
-            'photoshop': 'Adobe Photoshop',
-            'lightroom': 'Adobe Lightroom',
-            'gimp': 'GIMP',
-            'affinity': 'Affinity Photo',
-            'capture one': 'Capture One',
-            'luminar': 'Luminar',
-            'snapseed': 'Snapseed',
-            'instagram': 'Instagram',
-            'vsco': 'VSCO',
-            'pixlr': 'Pixlr',
-            'paintshop': 'PaintShop Pro',
-            'photolab': 'DxO PhotoLab',
-            'acdsee': 'ACDSee',
-            'aperture': 'Apple Aperture',
-            'photos': 'Apple Photos',
-            'picasa': 'Google Picasa',
-            'darktable': 'Darktable',
-            'rawtherapee': 'RawTherapee',
-            'pixelmator': 'Pixelmator',
-        }
+        Args:
+            cache_file: SQLite file to persist fuzzy lookup results in, e.g.
+                DEVICE_CACHE_FILE; results are not persisted if None
+        """
+        # Device database, shared by all instances
+        self.device_db = self._get_device_db()
+        self._build_device_index()
+        
+        # Formatted output of database entries, keyed by id() of the entry
+        self._formatted_cache = {}
+        
+        # Connection to the persistent lookup cache, opened on first use
+        self._device_cache_file = cache_file
+        self._device_cache_conn = None
+        self._device_cache_pending = 0
+        self._device_cache_lock = threading.Lock()
         
         logger.debug("DeviceIdentifier initialized")
     
-    def _load_device_database(self) -> Dict[str, Any]:
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_device_db(cls) -> Dict[str, Any]:
+        """
+        Get the device database, loading it on first use.
+        
+        The database is parsed once per process and shared by every
+        DeviceIdentifier instance.
+        
+        Returns:
+            Dictionary containing device information
+        """
+        return cls._load_device_database()
+    
+    @staticmethod
+    def _load_device_database() -> Dict[str, Any]:
         """
         Load the device database from JSON file.
         
@@ -100,23 +857,12 @@ class DeviceIdentifier:
             Dictionary containing device information
         """
         try:
-            # Try to load the database from the package directory
-            db_path = os.path.join(os.path.dirname(__file__), 'data', 'device_database.json')
-            
-            if os.path.exists(db_path):
-                with open(db_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            
-            # If not found, try to load from a few other possible locations
-            alt_paths = [
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'device_database.json'),
-                os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'device_database.json'),
-            ]
-            
-            for path in alt_paths:
-                if os.path.exists(path):
-                    with open(path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+            # Try the package directory first, then a few other possible locations
+            path = _find_device_db_path()
+            if path is not None:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             
             # If no database file is found, return an empty database
             logger.warning("Device database file not found. Using empty database.")
@@ -137,6 +883,63 @@ class DeviceIdentifier:
                 "lenses": {}
             }
     
+    def _build_device_index(self) -> None:
+        """
+        Build lookup indexes over the device database.
+        
+        Creates an exact (make, model) index and a per-make list of models for
+        each category, plus lowercased shadows of every entry's names in
+        database order, so lookups and searches need no per-entry
+        normalization; release years are parsed here once for search
+        relevance. A trigram index over the "make model" names narrows
+        searches down to the entries that can contain the query.
+        """
+        self._device_index = {}
+        self._make_index = {}
+        self._lowercase_entries = {}
+        self._trigram_index = {}
+        
+        for category, devices in self.device_db.items():
+            exact_index = {}
+            make_index = defaultdict(list)
+            entries = []
+            trigram_index = defaultdict(set)
+            
+            for position, device_info in enumerate(devices.values()):
+                make_lower = device_info.get('make', '').lower()
+                model_lower = device_info.get('model', '').lower()
+                full_name = f"{make_lower} {model_lower}"
+                release_year = _release_year(device_info.get('release_date'))
+                entries.append((make_lower, model_lower, full_name, release_year, device_info))
+                
+                for trigram in _trigrams(full_name):
+                    trigram_index[trigram].add(position)
+                
+                # Keep the first entry for duplicate names, as a scan would
+                exact_index.setdefault((make_lower, model_lower), device_info)
+                make_index[make_lower].append((model_lower, device_info))
+            
+            self._device_index[category] = exact_index
+            self._make_index[category] = dict(make_index)
+            self._lowercase_entries[category] = entries
+            self._trigram_index[category] = dict(trigram_index)
+        
+        # Lowercased software names, for get_software_info
+        self._software_names = [
+            (software_info.get('name', '').lower(), software_info)
+            for software_info in self.device_db.get('software', {}).values()
+        ]
+        
+        # Entry counts for get_device_database_stats
+        self._database_stats = {category: len(devices) for category, devices in self.device_db.items()}
+        self._database_stats['total'] = sum(self._database_stats.values())
+        
+        # Lookup results depend on the indexes, so start with a fresh cache
+        self._cached_lookup = functools.lru_cache(maxsize=4096)(self._lookup_persisted_device)
+        
+        # Persisted results are only valid for this version of the database file
+        self._db_signature = _device_db_signature()
+    
     def identify_device(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
         Identify device information from metadata.
@@ -147,99 +950,131 @@ class DeviceIdentifier:
         Returns:
             Dictionary with device information
         """
-        device_info = {}
+        device_info = DeviceInfo()
+        
+        # Collect every device field in one pass over the metadata
+        fields = _scan_metadata(metadata)
+        
+        # Extract basic device information
+        make, model = self._extract_make_model(metadata, fields)
+        software = self._extract_software(metadata, fields)
+        
+        # Add to device info if found
+        if make:
+            device_info.DeviceMake = make
+        
+        if model:
+            device_info.DeviceModel = model
+        
+        if software:
+            device_info.Software = software
+        
+        # Lowercase make and model once for the matching stages below
+        make_lower = make.lower() if make else ''
+        model_lower = model.lower() if model else ''
+        
+        # Identify device type; an explicit type in the metadata is used
+        # as is, without classifying the make and model
+        if 'DeviceType' in metadata:
+            device_type = metadata['DeviceType']
+        else:
+            device_type = self._identify_device_type(make_lower, model_lower, metadata)
+        if device_type:
+            device_info.DeviceType = device_type
+        
+        # Extract lens information for cameras
+        if device_type == 'Camera':
+            lens_info = self._extract_lens_info(metadata, fields)
+            if lens_info:
+                device_info.update(lens_info)
+        
+        # Extract additional device details
+        additional_info = self._extract_additional_device_info(metadata, device_type, fields)
+        if additional_info:
+            device_info.update(additional_info)
         
+        # Look up device in database for more details; a malformed database
+        # entry should not cost the details already extracted
         try:
-            # Extract basic device information
-            make, model = self._extract_make_model(metadata)
-            software = self._extract_software(metadata)
-            
-            # Add to device info if found
-            if make:
-                device_info['DeviceMake'] = make
-            
-            if model:
-                device_info['DeviceModel'] = model
-            
-            if software:
-                device_info['Software'] = software
-            
-            # Identify device type
-            device_type = self._identify_device_type(make, model, metadata)
-            if device_type:
-                device_info['DeviceType'] = device_type
-            
-            # Extract lens information for cameras
-            if device_type == 'Camera':
-                lens_info = self._extract_lens_info(metadata)
-                if lens_info:
-                    device_info.update(lens_info)
-            
-            # Extract additional device details
-            additional_info = self._extract_additional_device_info(metadata, device_type)
-            if additional_info:
-                device_info.update(additional_info)
-            
-            # Look up device in database for more details
-            db_info = self._lookup_device_in_database(make, model, device_type)
-            if db_info:
-                # Don't overwrite existing info, only add missing details
-                for key, value in db_info.items():
-                    if key not in device_info:
-                        device_info[key] = value
-            
-            # Add normalized manufacturer name
-            if make and 'Manufacturer' not in device_info:
-                normalized_make = self._normalize_manufacturer(make)
-                if normalized_make != make:
-                    device_info['Manufacturer'] = normalized_make
+            db_info = self._lookup_device_in_database(make_lower, model_lower, device_type)
+        except (KeyError, TypeError) as e:
+            logger.error("Error looking up device in database: %s", e)
+            db_info = {}
+        
+        if db_info:
+            # Don't overwrite existing info, only add missing details
+            device_info.update(db_info, overwrite=False)
+        
+        # Add normalized manufacturer name
+        if make and device_info.Manufacturer is None:
+            normalized_make = self._normalize_manufacturer(make)
+            if normalized_make != make:
+                device_info.Manufacturer = normalized_make
+        
+        # Add full device name
+        if make and model and device_info.DeviceName is None:
+            device_info.DeviceName = f"{make} {model}"
+        
+        return device_info.to_dict()
+    
+    def identify_devices(self, metadata_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Identify device information for a batch of images.
+        
+        Images whose device-related metadata is identical, as in a folder shot
+        with one camera, are identified once and share the result.
+        
+        Args:
+            metadata_list: Metadata dictionaries, one per image
             
-            # Add full device name
-            if make and model and 'DeviceName' not in device_info:
-                device_info['DeviceName'] = f"{make} {model}"
+        Returns:
+            List of device information dictionaries, in the same order
+        """
+        results = []
+        identified = {}
+        
+        for metadata in metadata_list:
+            signature = _device_signature(metadata)
+            if signature is None:
+                results.append(self.identify_device(metadata))
+                continue
             
-            return device_info
+            device_info = identified.get(signature)
+            if device_info is None:
+                device_info = self.identify_device(metadata)
+                identified[signature] = device_info
             
-        except Exception as e:
-            logger.error(f"Error identifying device: {e}")
-            return device_info
+            # Give each image its own dictionary
+            results.append(dict(device_info))
+        
+        return results
     
-    def _extract_make_model(self, metadata: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    def _extract_make_model(self, metadata: Dict[str, Any], fields: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[str]]:
         """
         Extract make and model information from metadata.
         
         Args:
             metadata: Dictionary containing image metadata
+            fields: Device fields from _scan_metadata, scanned if omitted
             
         Returns:
             Tuple of (make, model) or (None, None) if not found
         """
+        if fields is None:
+            fields = _scan_metadata(metadata)
+        
         make = None
         model = None
         
         # Check for make in various metadata fields
-        make_keys = [
-            'Make', 'make', 'EXIF:Make', 'IFD0:Make', 'Image Make',
-            'Manufacturer', 'CameraManufacturer', 'DeviceManufacturer',
-            'EXIF:Manufacturer', 'XMP:Manufacturer', 'IPTC:Manufacturer'
-        ]
-        
-        for key in make_keys:
-            if key in metadata and metadata[key]:
-                make = str(metadata[key]).strip()
-                break
+        value = fields.get('make')
+        if value:
+            make = str(value).strip()
         
         # Check for model in various metadata fields
-        model_keys = [
-            'Model', 'model', 'EXIF:Model', 'IFD0:Model', 'Image Model',
-            'CameraModel', 'DeviceModel', 'EXIF:CameraModel',
-            'XMP:Model', 'IPTC:Model'
-        ]
-        
-        for key in model_keys:
-            if key in metadata and metadata[key]:
-                model = str(metadata[key]).strip()
-                break
+        value = fields.get('model')
+        if value:
+            model = str(value).strip()
         
         # Clean up make and model
         if make:
@@ -254,27 +1089,24 @@ class DeviceIdentifier:
         
         return make, model
     
-    def _extract_software(self, metadata: Dict[str, Any]) -> Optional[str]:
+    def _extract_software(self, metadata: Dict[str, Any], fields: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Extract software information from metadata.
         
         Args:
             metadata: Dictionary containing image metadata
+            fields: Device fields from _scan_metadata, scanned if omitted
             
         Returns:
             Software name or None if not found
         """
-        # Check for software in various metadata fields
-        software_keys = [
-            'Software', 'software', 'EXIF:Software', 'IFD0:Software', 'Image Software',
-            'ProcessingSoftware', 'CreatorTool', 'XMP:CreatorTool', 'XMP:Software',
-            'IPTC:ProcessingSoftware'
-        ]
+        if fields is None:
+            fields = _scan_metadata(metadata)
         
-        for key in software_keys:
-            if key in metadata and metadata[key]:
-                software = str(metadata[key]).strip()
-                return self._clean_device_string(software)
+        # Check for software in various metadata fields
+        value = fields.get('software')
+        if value:
+            return self._clean_device_string(str(value).strip())
         
         return None
     
@@ -291,27 +1123,25 @@ class DeviceIdentifier:
         if not text:
             return ""
         
-        # Convert to string if not already
+        # Remove null bytes and other ASCII control characters; ASCII input
+        # (the common case) is filtered on its encoded bytes
         text = str(text)
-        
-        # Remove null bytes and trim
-        text = text.replace('\x00', '').strip()
-        
-        # Remove ASCII control characters
-        text = ''.join(c for c in text if ord(c) >= 32 or ord(c) == 9)
+        try:
+            text = text.encode('ascii').translate(None, _CTRL_BYTES).decode('ascii')
+        except UnicodeEncodeError:
+            text = text.translate(_CTRL_TBL)
+        text = text.strip()
         
         # Replace multiple spaces with a single space
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text
+        return _WS_RE.sub(' ', text)
     
-    def _identify_device_type(self, make: Optional[str], model: Optional[str], metadata: Dict[str, Any]) -> Optional[str]:
+    def _identify_device_type(self, make_lower: str, model_lower: str, metadata: Dict[str, Any]) -> Optional[str]:
         """
         Identify the type of device that captured the image.
         
         Args:
-            make: Device manufacturer
-            model: Device model
+            make_lower: Lowercased device manufacturer, or '' if unknown
+            model_lower: Lowercased device model, or '' if unknown
             metadata: Dictionary containing image metadata
             
         Returns:
@@ -322,58 +1152,39 @@ class DeviceIdentifier:
             return metadata['DeviceType']
         
         # If no make/model, we can't determine the device type
-        if not make and not model:
+        if not make_lower and not model_lower:
             return None
         
-        # Convert to lowercase for comparison
-        make_lower = make.lower() if make else ""
-        model_lower = model.lower() if model else ""
-        
         # Check for smartphone manufacturers
-        smartphone_manufacturers = [
-            'apple', 'iphone', 'samsung', 'huawei', 'xiaomi', 'google', 'pixel',
-            'oneplus', 'oppo', 'vivo', 'motorola', 'lg', 'htc', 'nokia', 'asus',
-            'lenovo', 'zte', 'realme', 'honor', 'poco'
-        ]
-        
-        if any(mfr in make_lower for mfr in smartphone_manufacturers):
+        if _SMARTPHONE_RE.search(make_lower):
             # Check if it's a tablet
-            tablet_indicators = ['ipad', 'tab', 'tablet', 'pad', 'galaxy tab']
-            if any(indicator in model_lower for indicator in tablet_indicators):
+            if _TABLET_RE.search(model_lower):
                 return 'Tablet'
             return 'Smartphone'
         
         # Check for camera manufacturers
-        camera_manufacturers = [
-            'canon', 'nikon', 'sony', 'fuji', 'fujifilm', 'olympus', 'panasonic',
-            'pentax', 'leica', 'hasselblad', 'kodak', 'sigma', 'ricoh'
-        ]
-        
-        if any(mfr in make_lower for mfr in camera_manufacturers):
+        if _CAMERA_RE.search(make_lower):
             return 'Camera'
         
         # Check for drone manufacturers
-        drone_manufacturers = ['dji', 'parrot', 'autel', 'skydio', 'yuneec']
-        if any(mfr in make_lower for mfr in drone_manufacturers):
+        if _DRONE_RE.search(make_lower):
             return 'Drone'
         
         # Check for action cameras
-        action_camera_indicators = ['gopro', 'hero', 'action', 'insta360']
-        if any(indicator in make_lower or indicator in model_lower for indicator in action_camera_indicators):
+        if _ACTION_CAMERA_RE.search(make_lower) or _ACTION_CAMERA_RE.search(model_lower):
             return 'Action Camera'
         
         # Check for specific model indicators
         if model_lower:
-            if any(indicator in model_lower for indicator in ['phone', 'smartphone']):
+            if _PHONE_MODEL_RE.search(model_lower):
                 return 'Smartphone'
-            if any(indicator in model_lower for indicator in ['camera', 'dslr', 'mirrorless']):
+            if _CAMERA_MODEL_RE.search(model_lower):
                 return 'Camera'
-            if any(indicator in model_lower for indicator in ['drone']):
+            if 'drone' in model_lower:
                 return 'Drone'
         
         # Check for lens information as an indicator of a dedicated camera
-        lens_indicators = ['Lens', 'LensModel', 'LensInfo', 'LensSerialNumber']
-        if any(key in metadata for key in lens_indicators):
+        if any(key in metadata for key in LENS_INDICATOR_KEYS):
             return 'Camera'
         
         # Check for focal length and aperture as indicators of a dedicated camera
@@ -384,98 +1195,70 @@ class DeviceIdentifier:
                 return 'Camera'
         
         # Default to generic "Digital Camera" if we can't determine more specifically
-        if make or model:
+        if make_lower or model_lower:
             return 'Digital Camera'
         
         return None
     
-    def _extract_lens_info(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_lens_info(self, metadata: Dict[str, Any], fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Extract lens information from metadata.
         
         Args:
             metadata: Dictionary containing image metadata
+            fields: Device fields from _scan_metadata, scanned if omitted
             
         Returns:
             Dictionary with lens information
         """
+        if fields is None:
+            fields = _scan_metadata(metadata)
+        
         lens_info = {}
         
         # Check for lens model
-        lens_model_keys = [
-            'LensModel', 'Lens', 'EXIF:LensModel', 'MakerNotes:LensModel',
-            'XMP:LensModel', 'Lens Model', 'Lens Info', 'LensInfo'
-        ]
-        
-        for key in lens_model_keys:
-            if key in metadata and metadata[key]:
-                lens_model = str(metadata[key]).strip()
-                lens_info['LensModel'] = self._clean_device_string(lens_model)
-                break
+        value = fields.get('lens_model')
+        if value:
+            lens_info['LensModel'] = self._clean_device_string(str(value).strip())
         
         # Check for lens make
-        lens_make_keys = [
-            'LensMake', 'EXIF:LensMake', 'MakerNotes:LensMake',
-            'XMP:LensMake', 'Lens Make'
-        ]
-        
-        for key in lens_make_keys:
-            if key in metadata and metadata[key]:
-                lens_make = str(metadata[key]).strip()
-                lens_info['LensMake'] = self._clean_device_string(lens_make)
-                break
+        value = fields.get('lens_make')
+        if value:
+            lens_info['LensMake'] = self._clean_device_string(str(value).strip())
         
         # Check for lens serial number
-        lens_serial_keys = [
-            'LensSerialNumber', 'EXIF:LensSerialNumber', 'MakerNotes:LensSerialNumber',
-            'XMP:LensSerialNumber', 'Lens Serial Number'
-        ]
-        
-        for key in lens_serial_keys:
-            if key in metadata and metadata[key]:
-                lens_serial = str(metadata[key]).strip()
-                lens_info['LensSerialNumber'] = self._clean_device_string(lens_serial)
-                break
+        value = fields.get('lens_serial')
+        if value:
+            lens_info['LensSerialNumber'] = self._clean_device_string(str(value).strip())
         
         # Extract lens specifications
-        lens_spec_keys = [
-            'LensSpecification', 'EXIF:LensSpecification', 'MakerNotes:LensSpecification',
-            'XMP:LensSpecification', 'Lens Specification'
-        ]
-        
-        for key in lens_spec_keys:
-            if key in metadata and metadata[key]:
-                lens_spec = metadata[key]
+        lens_spec = fields.get('lens_spec')
+        if isinstance(lens_spec, (list, tuple)) and len(lens_spec) >= 4:
+            try:
+                min_focal_length = float(lens_spec[0])
+                max_focal_length = float(lens_spec[1])
+                min_aperture = float(lens_spec[2])
+                max_aperture = float(lens_spec[3])
                 
-                # Process lens specifications
-                if isinstance(lens_spec, (list, tuple)) and len(lens_spec) >= 4:
-                    try:
-                        min_focal_length = float(lens_spec[0])
-                        max_focal_length = float(lens_spec[1])
-                        min_aperture = float(lens_spec[2])
-                        max_aperture = float(lens_spec[3])
-                        
-                        lens_info['MinFocalLength'] = min_focal_length
-                        lens_info['MaxFocalLength'] = max_focal_length
-                        lens_info['MinAperture'] = min_aperture
-                        lens_info['MaxAperture'] = max_aperture
-                        
-                        # Create a human-readable lens specification
-                        if min_focal_length == max_focal_length:
-                            focal_length_str = f"{min_focal_length}mm"
-                        else:
-                            focal_length_str = f"{min_focal_length}-{max_focal_length}mm"
-                        
-                        if min_aperture == max_aperture:
-                            aperture_str = f"f/{min_aperture}"
-                        else:
-                            aperture_str = f"f/{min_aperture}-{max_aperture}"
-                        
-                        lens_info['LensSpecification'] = f"{focal_length_str} {aperture_str}"
-                    except (ValueError, TypeError):
-                        pass
+                lens_info['MinFocalLength'] = min_focal_length
+                lens_info['MaxFocalLength'] = max_focal_length
+                lens_info['MinAperture'] = min_aperture
+                lens_info['MaxAperture'] = max_aperture
+                
+                # Create a human-readable lens specification
+                if min_focal_length == max_focal_length:
+                    focal_length_str = f"{min_focal_length}mm"
+                else:
+                    focal_length_str = f"{min_focal_length}-{max_focal_length}mm"
+                
+                if min_aperture == max_aperture:
+                    aperture_str = f"f/{min_aperture}"
+                else:
+                    aperture_str = f"f/{min_aperture}-{max_aperture}"
                 
-                break
+                lens_info['LensSpecification'] = f"{focal_length_str} {aperture_str}"
+            except (ValueError, TypeError):
+                pass
         
         # If we have a lens model but no lens make, try to extract make from model
         if 'LensModel' in lens_info and 'LensMake' not in lens_info:
@@ -505,211 +1288,100 @@ class DeviceIdentifier:
         if not lens_model:
             return None
         
-        # Common lens manufacturers
-        lens_manufacturers = {
-            'canon': 'Canon',
-            'ef-s': 'Canon',
-            'ef-m': 'Canon',
-            'ef': 'Canon',
-            'rf': 'Canon',
-            'nikkor': 'Nikon',
-            'nikon': 'Nikon',
-            'sony': 'Sony',
-            'zeiss': 'Zeiss',
-            'leica': 'Leica',
-            'sigma': 'Sigma',
-            'tamron': 'Tamron',
-            'tokina': 'Tokina',
-            'samyang': 'Samyang',
-            'rokinon': 'Rokinon',
-            'voigtlander': 'Voigtlander',
-            'olympus': 'Olympus',
-            'zuiko': 'Olympus',
-            'panasonic': 'Panasonic',
-            'lumix': 'Panasonic',
-            'fuji': 'Fujifilm',
-            'fujinon': 'Fujifilm',
-            'fujifilm': 'Fujifilm',
-            'pentax': 'Pentax',
-            'hasselblad': 'Hasselblad',
-            'schneider': 'Schneider',
-            'mamiya': 'Mamiya',
-            'meyer': 'Meyer-Optik',
-            'laowa': 'Laowa',
-            'venus': 'Venus Optics',
-            'irix': 'Irix',
-            'ttartisan': 'TTArtisan',
-            '7artisans': '7Artisans'
-        }
-        
-        lens_model_lower = lens_model.lower()
-        
-        # Check if the lens model starts with a known manufacturer
-        for key, manufacturer in lens_manufacturers.items():
-            if lens_model_lower.startswith(key):
-                return manufacturer
-            if key in lens_model_lower:
-                # If the manufacturer is in the model string, check if it's at a word boundary
-                pattern = r'\b' + re.escape(key) + r'\b'
-                if re.search(pattern, lens_model_lower):
-                    return manufacturer
-        
-        return None
+        return _lens_make_from_model(lens_model.lower())
     
-    def _extract_additional_device_info(self, metadata: Dict[str, Any], device_type: Optional[str]) -> Dict[str, Any]:
+    def _extract_additional_device_info(self, metadata: Dict[str, Any], device_type: Optional[str],
+                                        fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Extract additional device information from metadata.
         
         Args:
             metadata: Dictionary containing image metadata
             device_type: Type of device
+            fields: Device fields from _scan_metadata, scanned if omitted
             
         Returns:
             Dictionary with additional device information
         """
+        if fields is None:
+            fields = _scan_metadata(metadata)
+        
         additional_info = {}
         
         # Extract camera serial number
-        serial_keys = [
-            'SerialNumber', 'CameraSerialNumber', 'BodySerialNumber',
-            'EXIF:SerialNumber', 'MakerNotes:SerialNumber',
-            'XMP:SerialNumber', 'Camera Serial Number'
-        ]
-        
-        for key in serial_keys:
-            if key in metadata and metadata[key]:
-                serial = str(metadata[key]).strip()
-                additional_info['DeviceSerialNumber'] = self._clean_device_string(serial)
-                break
+        value = fields.get('serial')
+        if value:
+            additional_info['DeviceSerialNumber'] = self._clean_device_string(str(value).strip())
         
         # Extract firmware version
-        firmware_keys = [
-            'FirmwareVersion', 'Firmware', 'EXIF:FirmwareVersion',
-            'MakerNotes:FirmwareVersion', 'XMP:FirmwareVersion'
-        ]
-        
-        for key in firmware_keys:
-            if key in metadata and metadata[key]:
-                firmware = str(metadata[key]).strip()
-                additional_info['FirmwareVersion'] = self._clean_device_string(firmware)
-                break
+        value = fields.get('firmware')
+        if value:
+            additional_info['FirmwareVersion'] = self._clean_device_string(str(value).strip())
         
         # Extract owner information
-        owner_keys = [
-            'OwnerName', 'CameraOwnerName', 'EXIF:OwnerName',
-            'MakerNotes:OwnerName', 'XMP:OwnerName', 'Owner'
-        ]
-        
-        for key in owner_keys:
-            if key in metadata and metadata[key]:
-                owner = str(metadata[key]).strip()
-                additional_info['OwnerName'] = self._clean_device_string(owner)
-                break
+        value = fields.get('owner')
+        if value:
+            additional_info['OwnerName'] = self._clean_device_string(str(value).strip())
         
         # Extract camera settings for dedicated cameras
         if device_type in ['Camera', 'Digital Camera', 'Action Camera']:
             # Extract shooting mode
-            mode_keys = [
-                'ExposureMode', 'ExposureProgram', 'SceneCaptureType',
-                'EXIF:ExposureMode', 'EXIF:ExposureProgram', 'EXIF:SceneCaptureType',
-                'MakerNotes:ExposureMode', 'XMP:ExposureMode'
-            ]
-            
-            for key in mode_keys:
-                if key in metadata and metadata[key] is not None:
-                    mode = metadata[key]
-                    
-                    # Convert numeric exposure program to text
-                    if key.endswith('ExposureProgram') and isinstance(mode, (int, str)) and str(mode).isdigit():
-                        mode_int = int(mode)
-                        exposure_programs = {
-                            0: 'Not Defined',
-                            1: 'Manual',
-                            2: 'Program AE',
-                            3: 'Aperture Priority',
-                            4: 'Shutter Priority',
-                            5: 'Creative (Slow Speed)',
-                            6: 'Action (High Speed)',
-                            7: 'Portrait',
-                            8: 'Landscape',
-                            9: 'Bulb'
-                        }
-                        mode = exposure_programs.get(mode_int, f"Unknown ({mode_int})")
-                    
-                    # Convert numeric scene capture type to text
-                    if key.endswith('SceneCaptureType') and isinstance(mode, (int, str)) and str(mode).isdigit():
+            if 'mode' in fields:
+                key, mode = fields['mode']
+                
+                # Convert numeric exposure program / scene capture type to text
+                mode_names = MODE_VALUE_NAMES.get(key)
+                if mode_names is not None:
+                    try:
                         mode_int = int(mode)
-                        scene_types = {
-                            0: 'Standard',
-                            1: 'Landscape',
-                            2: 'Portrait',
-                            3: 'Night',
-                            4: 'Night Portrait',
-                            5: 'Backlight',
-                            6: 'Backlight Portrait',
-                            7: 'Macro',
-                            8: 'Sports',
-                            9: 'Action',
-                            10: 'Fireworks',
-                            11: 'Children',
-                            12: 'Pets'
-                        }
-                        mode = scene_types.get(mode_int, f"Unknown ({mode_int})")
+                    except (TypeError, ValueError, OverflowError):
+                        mode_int = None
                     
-                    additional_info['ShootingMode'] = str(mode)
-                    break
+                    if mode_int is not None:
+                        mode = mode_names.get(mode_int, f"Unknown ({mode_int})")
+                
+                additional_info['ShootingMode'] = str(mode)
         
         # Extract smartphone-specific information
         if device_type in ['Smartphone', 'Tablet']:
             # Check for OS version
-            os_keys = [
-                'OSVersion', 'OperatingSystem', 'Software',
-                'XMP:OSVersion', 'XMP:OperatingSystem'
-            ]
-            
-            for key in os_keys:
-                if key in metadata and metadata[key]:
-                    os_version = str(metadata[key]).strip()
-                    
-                    # Try to extract OS name and version
-                    if 'iOS' in os_version or 'iPhone OS' in os_version:
-                        additional_info['OperatingSystem'] = 'iOS'
-                        # Extract version number
-                        version_match = re.search(r'(\d+(?:\.\d+)*)', os_version)
-                        if version_match:
-                            additional_info['OSVersion'] = version_match.group(1)
-                    elif 'Android' in os_version:
-                        additional_info['OperatingSystem'] = 'Android'
-                        # Extract version number
-                        version_match = re.search(r'(\d+(?:\.\d+)*)', os_version)
-                        if version_match:
-                            additional_info['OSVersion'] = version_match.group(1)
-                    else:
-                        additional_info['OSVersion'] = self._clean_device_string(os_version)
-                    
-                    break
+            value = fields.get('os')
+            if value:
+                os_version = str(value).strip()
+                
+                # Try to extract OS name and version
+                if 'iOS' in os_version or 'iPhone OS' in os_version:
+                    additional_info['OperatingSystem'] = 'iOS'
+                    # Extract version number
+                    version_match = _OS_VERSION_RE.search(os_version)
+                    if version_match:
+                        additional_info['OSVersion'] = version_match.group(1)
+                elif 'Android' in os_version:
+                    additional_info['OperatingSystem'] = 'Android'
+                    # Extract version number
+                    version_match = _OS_VERSION_RE.search(os_version)
+                    if version_match:
+                        additional_info['OSVersion'] = version_match.group(1)
+                else:
+                    additional_info['OSVersion'] = self._clean_device_string(os_version)
         
         return additional_info
     
-    def _lookup_device_in_database(self, make: Optional[str], model: Optional[str], device_type: Optional[str]) -> Dict[str, Any]:
+    def _lookup_device_in_database(self, make_lower: str, model_lower: str, device_type: Optional[str]) -> Dict[str, Any]:
         """
         Look up device information in the database.
         
         Args:
-            make: Device manufacturer
-            model: Device model
+            make_lower: Lowercased device manufacturer
+            model_lower: Lowercased device model
             device_type: Type of device
             
         Returns:
             Dictionary with device information from database
         """
-        if not make or not model or not self.device_db:
+        if not make_lower or not model_lower or not self.device_db:
             return {}
         
-        # Normalize make and model for lookup
-        make_lower = make.lower()
-        model_lower = model.lower()
-        
         # Determine which database to search based on device type
         db_category = 'cameras'
         if device_type == 'Smartphone':
@@ -719,47 +1391,191 @@ class DeviceIdentifier:
         elif device_type == 'Drone':
             db_category = 'cameras'  # Drones are in the cameras database
         
-        # Check if the database has this category
-        if db_category not in self.device_db:
+        # Results are memoized per (make, model, category), since the device
+        # type itself may come straight from metadata and need not be
+        # hashable; hand out a copy so callers cannot modify the cached entry
+        return dict(self._cached_lookup(make_lower, model_lower, db_category))
+    
+    def _lookup_persisted_device(self, make_lower: str, model_lower: str, db_category: str) -> Dict[str, Any]:
+        """
+        Look up a device, reusing fuzzy matches persisted by earlier runs.
+        
+        Exact (make, model) hits are answered from the index. When the
+        identifier has a cache file, devices found by fuzzy matching are
+        stored in it, keyed by the database file version, so repeated runs
+        over the same devices skip the fuzzy match.
+        
+        Args:
+            make_lower: Lowercased device manufacturer
+            model_lower: Lowercased device model
+            db_category: Database category to search
+            
+        Returns:
+            Dictionary with device information from database
+        """
+        exact_index = self._device_index.get(db_category)
+        if exact_index is None:
             return {}
         
-        # Search for the device in the database
-        device_db = self.device_db[db_category]
+        device_info = exact_index.get((make_lower, model_lower))
+        if device_info is not None:
+            return self._format_db_device_info(device_info)
         
-        # First, try exact match on make and model
-        for device_id, device_info in device_db.items():
-            db_make = device_info.get('make', '').lower()
-            db_model = device_info.get('model', '').lower()
+        if self._device_cache_file is None or self._db_signature is None:
+            return self._lookup_indexed_device(make_lower, model_lower, db_category)
+        
+        key = (self._db_signature, make_lower, model_lower, db_category)
+        
+        try:
+            row = self._execute_device_cache(
+                "SELECT payload FROM dev_cache "
+                "WHERE db_signature = ? AND make = ? AND model = ? AND category = ?",
+                key
+            )
+            if row is not None:
+                return orjson.loads(row[0]) if ORJSON_AVAILABLE else json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.debug(f"Device lookup cache unavailable: {e}")
+            self._db_signature = None
+        
+        result = self._lookup_indexed_device(make_lower, model_lower, db_category)
+        
+        # Misses are not persisted; the database may gain the device later
+        if result and self._db_signature is not None:
+            try:
+                payload = orjson.dumps(result) if ORJSON_AVAILABLE else json.dumps(result)
+                self._execute_device_cache(
+                    "INSERT OR REPLACE INTO dev_cache VALUES (?, ?, ?, ?, ?)",
+                    key + (payload,), write=True
+                )
+            except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+                logger.debug(f"Device lookup cache unavailable: {e}")
+                self._db_signature = None
+        
+        return result
+    
+    def _execute_device_cache(self, sql: str, params: Tuple = (), write: bool = False) -> Optional[Tuple]:
+        """
+        Run one statement on the persistent lookup cache.
+        
+        Writes are committed in batches of DEVICE_CACHE_COMMIT_INTERVAL; the
+        rest are committed by flush_device_cache or when the identifier is
+        garbage collected or the interpreter exits.
+        
+        Args:
+            sql: SQL statement to run
+            params: Statement parameters
+            write: Whether the statement modifies the cache
             
-            if db_make == make_lower and db_model == model_lower:
-                return self._format_db_device_info(device_info)
+        Returns:
+            First row of the result, or None if there is none
+        """
+        with self._device_cache_lock:
+            conn = self._device_cache_conn
+            if conn is None:
+                conn = self._connect_device_cache(self._device_cache_file)
+                self._device_cache_conn = conn
+                # The finalizer holds only the connection, not the identifier
+                weakref.finalize(self, _close_device_cache, conn)
+            
+            row = conn.execute(sql, params).fetchone()
+            
+            if write:
+                self._device_cache_pending += 1
+                if self._device_cache_pending >= DEVICE_CACHE_COMMIT_INTERVAL:
+                    conn.commit()
+                    self._device_cache_pending = 0
+            
+            return row
+    
+    def flush_device_cache(self) -> None:
+        """Commit persisted lookups that are still pending."""
+        with self._device_cache_lock:
+            if self._device_cache_conn is None or not self._device_cache_pending:
+                return
+            
+            try:
+                self._device_cache_conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Could not save device lookup cache: {e}")
+            self._device_cache_pending = 0
+    
+    @staticmethod
+    def _connect_device_cache(cache_file: str) -> sqlite3.Connection:
+        """Open the persistent lookup cache, creating it if needed."""
+        os.makedirs(os.path.dirname(os.path.abspath(cache_file)), exist_ok=True)
+        # Lookups may run on worker threads; _execute_device_cache serializes them
+        conn = sqlite3.connect(cache_file, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS dev_cache ("
+            "db_signature TEXT, make TEXT, model TEXT, category TEXT, payload BLOB, "
+            "PRIMARY KEY (db_signature, make, model, category))"
+        )
+        return conn
+    
+    def _clear_device_cache(self) -> None:
+        """Remove all persisted lookup results."""
+        if self._device_cache_file is None or not os.path.exists(self._device_cache_file):
+            return
         
-        # If no exact match, try fuzzy matching
-        for device_id, device_info in device_db.items():
-            db_make = device_info.get('make', '').lower()
-            db_model = device_info.get('model', '').lower()
+        try:
+            self._execute_device_cache("DELETE FROM dev_cache", write=True)
+            self.flush_device_cache()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Could not clear device lookup cache: {e}")
+    
+    def _lookup_indexed_device(self, make_lower: str, model_lower: str, db_category: str) -> Dict[str, Any]:
+        """
+        Look up a device in the database indexes.
+        
+        Args:
+            make_lower: Lowercased device manufacturer
+            model_lower: Lowercased device model
+            db_category: Database category to search
             
-            # Check if make matches and model is similar
-            if db_make == make_lower and (
-                model_lower in db_model or db_model in model_lower or
-                self._string_similarity(db_model, model_lower) > 0.8
-            ):
+        Returns:
+            Dictionary with device information from database
+        """
+        # Check if the database has this category
+        if db_category not in self._device_index:
+            return {}
+        
+        # First, try exact match on make and model
+        device_info = self._device_index[db_category].get((make_lower, model_lower))
+        if device_info is not None:
+            return self._format_db_device_info(device_info)
+        
+        # If no exact match, try fuzzy matching among models of the same
+        # make, taking the first match in database order
+        for db_model, device_info in self._make_index[db_category].get(make_lower, ()):
+            if (model_lower in db_model or db_model in model_lower or
+                    self._string_similarity(db_model, model_lower) > 0.8):
                 return self._format_db_device_info(device_info)
         
-        # If still no match, try even more fuzzy matching
+        # If still no match, try even more fuzzy matching over all entries in
+        # database order, so ties go to the earliest entry; the make score is
+        # shared by every model of that make
+        make_scores = {
+            db_make: self._string_similarity(db_make, make_lower)
+            for db_make in self._make_index[db_category]
+        }
+        
+        # Entries whose make keeps even a perfect model match at or below
+        # the threshold can never be chosen, so their models are not scored
+        entries = [
+            entry for entry in self._lowercase_entries[db_category]
+            if (make_scores[entry[0]] * 0.4) + 0.6 > 0.7
+        ]
+        model_scores = self._string_similarity_many(
+            model_lower, [db_model for _, db_model, _, _, _ in entries]
+        )
+        
         best_match = None
         best_score = 0
         
-        for device_id, device_info in device_db.items():
-            db_make = device_info.get('make', '').lower()
-            db_model = device_info.get('model', '').lower()
-            
-            # Calculate similarity scores
-            make_score = self._string_similarity(db_make, make_lower)
-            model_score = self._string_similarity(db_model, model_lower)
-            
+        for (db_make, _, _, _, device_info), model_score in zip(entries, model_scores):
             # Combined score with more weight on model
-            combined_score = (make_score * 0.4) + (model_score * 0.6)
+            combined_score = (make_scores[db_make] * 0.4) + (model_score * 0.6)
             
             if combined_score > best_score and combined_score > 0.7:
                 best_score = combined_score
@@ -780,35 +1596,21 @@ class DeviceIdentifier:
         Returns:
             Formatted device information
         """
-        formatted = {}
+        # Formatting is memoized per entry; the entry itself is kept with the
+        # result so a reused id() can never return another entry's output
+        cached = self._formatted_cache.get(id(device_info))
+        if cached is not None and cached[0] is device_info:
+            return dict(cached[1])
         
-        # Map database fields to output fields
-        field_mapping = {
-            'make': 'Manufacturer',
-            'model': 'FullModel',
-            'release_date': 'ReleaseDate',
-            'sensor_type': 'SensorType',
-            'sensor_size': 'SensorSize',
-            'megapixels': 'Megapixels',
-            'max_resolution': 'MaxResolution',
-            'lens_mount': 'LensMount',
-            'screen_size': 'ScreenSize',
-            'os': 'OperatingSystem',
-            'cpu': 'Processor',
-            'storage': 'Storage',
-            'battery': 'Battery',
-            'weight': 'Weight',
-            'dimensions': 'Dimensions',
-            'price': 'Price',
-            'url': 'ProductURL'
-        }
+        formatted = {}
         
         # Copy and rename fields
-        for db_field, output_field in field_mapping.items():
+        for db_field, output_field in DB_FIELD_MAPPING.items():
             if db_field in device_info and device_info[db_field]:
                 formatted[output_field] = device_info[db_field]
         
-        return formatted
+        self._formatted_cache[id(device_info)] = (device_info, formatted)
+        return dict(formatted)
     
     def _string_similarity(self, s1: str, s2: str) -> float:
         """
@@ -833,21 +1635,47 @@ class DeviceIdentifier:
         if s1 in s2 or s2 in s1:
             return 0.9
         
-        # Calculate Levenshtein distance
-        try:
-            from Levenshtein import distance
-            max_len = max(len(s1), len(s2))
-            if max_len == 0:
-                return 1.0
-            return 1.0 - (distance(s1, s2) / max_len)
-        except ImportError:
-            # Fallback to a simpler similarity measure
-            # Count matching characters
-            matches = sum(c1 == c2 for c1, c2 in zip(s1, s2))
-            max_len = max(len(s1), len(s2))
-            if max_len == 0:
-                return 1.0
-            return matches / max_len
+        # rapidfuzz computes the same normalized Levenshtein similarity in C++
+        if RAPIDFUZZ_AVAILABLE:
+            return Levenshtein.normalized_similarity(s1, s2)
+        
+        # Fallback to the same measure in pure Python
+        return 1 - _levenshtein_distance(s1, s2) / max(len(s1), len(s2))
+    
+    def _string_similarity_many(self, query: str, candidates: List[str]) -> List[float]:
+        """
+        Calculate the similarity between a string and each of many candidates.
+        
+        Gives the same scores as _string_similarity, but with rapidfuzz the
+        whole candidate list is scored in a single call.
+        
+        Args:
+            query: String to compare
+            candidates: Strings to compare against
+            
+        Returns:
+            Similarity scores between 0 and 1, in candidate order
+        """
+        if not RAPIDFUZZ_AVAILABLE or not query:
+            return [self._string_similarity(query, candidate) for candidate in candidates]
+        
+        query = query.lower()
+        lowered = [candidate.lower() for candidate in candidates]
+        
+        scores = [0.0] * len(lowered)
+        for _, score, index in process.extract(
+                query, lowered, scorer=Levenshtein.normalized_similarity,
+                processor=None, limit=None):
+            scores[index] = score
+        
+        # Apply the containment and empty-string rules of _string_similarity
+        for index, candidate in enumerate(lowered):
+            if not candidate:
+                scores[index] = 0
+            elif query in candidate or candidate in query:
+                scores[index] = 0.9
+        
+        return scores
     
     def _normalize_manufacturer(self, make: str) -> str:
         """
@@ -862,15 +1690,7 @@ class DeviceIdentifier:
         if not make:
             return make
         
-        make_lower = make.lower()
-        
-        # Check against known manufacturers
-        for key, normalized in self.known_manufacturers.items():
-            if key == make_lower or make_lower.startswith(key):
-                return normalized
-        
-        # If not found, return the original with proper capitalization
-        return make
+        return _normalize_manufacturer_name(make)
     
     def get_device_database_stats(self) -> Dict[str, int]:
         """
@@ -879,17 +1699,11 @@ class DeviceIdentifier:
         Returns:
             Dictionary with database statistics
         """
-        stats = {}
-        
         if not self.device_db:
             return {'total': 0}
         
-        for category, devices in self.device_db.items():
-            stats[category] = len(devices)
-        
-        stats['total'] = sum(stats.values())
-        
-        return stats
+        # Counted whenever the indexes are rebuilt
+        return dict(self._database_stats)
     
     def search_device_database(self, query: str, device_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -911,36 +1725,98 @@ class DeviceIdentifier:
         # Determine which categories to search
         categories = list(self.device_db.keys())
         if device_type:
-            if device_type.lower() in ['camera', 'digital camera']:
-                categories = ['cameras']
-            elif device_type.lower() in ['smartphone', 'phone', 'mobile']:
-                categories = ['phones']
-            elif device_type.lower() in ['lens', 'camera lens']:
-                categories = ['lenses']
-            elif device_type.lower() in ['software', 'app', 'application']:
-                categories = ['software']
-        
-        # Search each category
+            category = SEARCH_CATEGORIES.get(device_type.lower())
+            if category:
+                categories = [category]
+        
+        categories = [category for category in categories if category in self._lowercase_entries]
+        
+        # Search each category; "make model" contains both the make and the
+        # model, so one substring test covers all three fields
         for category in categories:
-            if category not in self.device_db:
-                continue
+            entries = self._lowercase_entries[category]
+            category_device_type = self._map_category_to_device_type(category)
             
-            for device_id, device_info in self.device_db[category].items():
-                # Check if query matches make or model
-                make = device_info.get('make', '').lower()
-                model = device_info.get('model', '').lower()
-                
-                if query in make or query in model or query in (make + ' ' + model):
+            # Only entries containing every trigram of the query can match
+            positions = self._search_candidates(category, query)
+            if positions is not None:
+                entries = [entries[position] for position in positions]
+            
+            for make, model, full_name, release_year, device_info in entries:
+                if query in full_name:
+                    # Score while the lowercase names are at hand
+                    score = self._calculate_search_relevance(make, model, release_year, query)
+                    
                     # Format the result
                     result = self._format_db_device_info(device_info)
-                    result['DeviceType'] = self._map_category_to_device_type(category)
-                    results.append(result)
+                    result['DeviceType'] = category_device_type
+                    results.append((score, result))
         
-        # Sort results by relevance
-        results.sort(key=lambda x: self._calculate_search_relevance(x, query), reverse=True)
+        # If no name contains the query, suggest the closest names instead
+        if not results and RAPIDFUZZ_AVAILABLE:
+            return self._fuzzy_search_device_database(query, categories)
         
-        # Limit to top 20 results
-        return results[:20]
+        # Return the top 20 results by relevance; ties keep database order
+        return [result for score, result in heapq.nlargest(20, results, key=itemgetter(0))]
+    
+    def _search_candidates(self, category: str, query: str) -> Optional[List[int]]:
+        """
+        Find the entries of a category that may contain a query.
+        
+        Args:
+            category: Database category to search
+            query: Lowercased search query
+            
+        Returns:
+            Sorted positions of the candidate entries, or None if the query is
+            too short to use the trigram index
+        """
+        query_trigrams = _trigrams(query)
+        if not query_trigrams:
+            return None
+        
+        trigram_index = self._trigram_index[category]
+        postings = []
+        for trigram in query_trigrams:
+            positions = trigram_index.get(trigram)
+            if not positions:
+                return []
+            postings.append(positions)
+        
+        # Intersect starting from the rarest trigram
+        postings.sort(key=len)
+        return sorted(set.intersection(*postings))
+    
+    def _fuzzy_search_device_database(self, query: str, categories: List[str]) -> List[Dict[str, Any]]:
+        """
+        Find the devices whose names best match a query, tolerating typos.
+        
+        All candidate names are scored in a single rapidfuzz call.
+        
+        Args:
+            query: Lowercased search query
+            categories: Database categories to search
+            
+        Returns:
+            Up to 20 matching devices, best match first
+        """
+        candidates = [
+            (category, full_name, device_info)
+            for category in categories
+            for _, _, full_name, _, device_info in self._lowercase_entries[category]
+        ]
+        
+        results = []
+        for _, _, index in process.extract(
+                query, [full_name for _, full_name, _ in candidates],
+                scorer=fuzz.WRatio, processor=None, limit=20,
+                score_cutoff=SEARCH_FUZZY_SCORE_CUTOFF):
+            category, _, device_info = candidates[index]
+            result = self._format_db_device_info(device_info)
+            result['DeviceType'] = self._map_category_to_device_type(category)
+            results.append(result)
+        
+        return results
     
     def _map_category_to_device_type(self, category: str) -> str:
         """
@@ -952,40 +1828,33 @@ class DeviceIdentifier:
         Returns:
             Device type
         """
-        category_map = {
-            'cameras': 'Camera',
-            'phones': 'Smartphone',
-            'lenses': 'Camera Lens',
-            'software': 'Software'
-        }
-        
-        return category_map.get(category, category.capitalize())
+        return CATEGORY_DEVICE_TYPES.get(category) or category.capitalize()
     
-    def _calculate_search_relevance(self, device: Dict[str, Any], query: str) -> float:
+    def _calculate_search_relevance(self, make: str, model: str,
+                                    release_year: Optional[int], query: str) -> float:
         """
         Calculate search result relevance score.
         
         Args:
-            device: Device information
-            query: Search query
+            make: Lowercase manufacturer name from the database
+            model: Lowercase model name from the database
+            release_year: Release year parsed from the database, if any
+            query: Lowercase search query
             
         Returns:
             Relevance score
         """
         score = 0.0
-        query = query.lower()
         
         # Check manufacturer match
-        if 'Manufacturer' in device:
-            manufacturer = device['Manufacturer'].lower()
-            if query == manufacturer:
+        if make:
+            if query == make:
                 score += 3.0
-            elif query in manufacturer:
+            elif query in make:
                 score += 1.5
         
         # Check model match
-        if 'FullModel' in device:
-            model = device['FullModel'].lower()
+        if model:
             if query == model:
                 score += 5.0
             elif query in model:
@@ -994,19 +1863,9 @@ class DeviceIdentifier:
                 score += 1.0
         
         # Newer devices get higher scores
-        if 'ReleaseDate' in device:
-            try:
-                release_date = device['ReleaseDate']
-                if isinstance(release_date, str):
-                    # Try to parse year from the release date
-                    year_match = re.search(r'(\d{4})', release_date)
-                    if year_match:
-                        year = int(year_match.group(1))
-                        current_year = datetime.now().year
-                        # Add up to 2.0 points for newer devices
-                        score += min(2.0, max(0, (year - 2000) / 10))
-            except:
-                pass
+        if release_year is not None:
+            # Add up to 2.0 points for newer devices
+            score += min(2.0, max(0, (release_year - 2000) / 10))
         
         return score
     
@@ -1026,12 +1885,24 @@ class DeviceIdentifier:
                 if category not in self.device_db:
                     self.device_db[category] = {}
                 
-                # Add or update devices
+                # Add or update devices, forgetting the formatted output of
+                # entries that are replaced
                 for device_id, device_info in devices.items():
+                    old_info = self.device_db[category].get(device_id)
+                    if old_info is not None:
+                        self._formatted_cache.pop(id(old_info), None)
                     self.device_db[category][device_id] = device_info
             
             # Save the updated database
-            self._save_device_database()
+            saved = self._save_device_database()
+            
+            # Rebuild lookup indexes for the new entries and drop persisted
+            # lookups, which were made against the old entries
+            self._build_device_index()
+            self._clear_device_cache()
+            if not saved:
+                # The file no longer matches memory, so stop persisting
+                self._db_signature = None
             
             return True
         except Exception as e:
@@ -1047,14 +1918,13 @@ class DeviceIdentifier:
         """
         try:
             # Try to save to the package directory
-            db_path = os.path.join(os.path.dirname(__file__), 'data', 'device_database.json')
+            db_path = DEVICE_DB_PATHS[0]
             
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
             
             # Save the database
-            with open(db_path, 'w', encoding='utf-8') as f:
-                json.dump(self.device_db, f, indent=2)
+            _write_device_db(db_path, self.device_db)
             
             logger.info(f"Device database saved to {db_path}")
             return True
@@ -1063,11 +1933,10 @@ class DeviceIdentifier:
             
             # Try alternate locations
             try:
-                alt_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'device_database.json')
+                alt_path = DEVICE_DB_PATHS[1]
                 os.makedirs(os.path.dirname(alt_path), exist_ok=True)
                 
-                with open(alt_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.device_db, f, indent=2)
+                _write_device_db(alt_path, self.device_db)
                 
                 logger.info(f"Device database saved to alternate location: {alt_path}")
                 return True
@@ -1091,24 +1960,21 @@ class DeviceIdentifier:
         software_name_lower = software_name.lower()
         
         # Check if we have this software in our database
-        if 'software' in self.device_db:
-            for software_id, software_info in self.device_db['software'].items():
-                db_name = software_info.get('name', '').lower()
-                
-                if software_name_lower == db_name or software_name_lower in db_name or db_name in software_name_lower:
-                    return {
-                        'SoftwareName': software_info.get('name', ''),
-                        'SoftwareVersion': software_info.get('version', ''),
-                        'SoftwareCompany': software_info.get('company', ''),
-                        'SoftwareType': software_info.get('type', ''),
-                        'SoftwareURL': software_info.get('url', '')
-                    }
+        for db_name, software_info in self._software_names:
+            if software_name_lower == db_name or software_name_lower in db_name or db_name in software_name_lower:
+                return {
+                    'SoftwareName': software_info.get('name', ''),
+                    'SoftwareVersion': software_info.get('version', ''),
+                    'SoftwareCompany': software_info.get('company', ''),
+                    'SoftwareType': software_info.get('type', ''),
+                    'SoftwareURL': software_info.get('url', '')
+                }
         
         # If not in database, try to identify common software
-        for key, normalized in self.known_software.items():
+        for key, normalized in KNOWN_SOFTWARE.items():
             if key in software_name_lower:
                 # Try to extract version number
-                version_match = re.search(r'(\d+(?:\.\d+)+)', software_name)
+                version_match = _SOFTWARE_VERSION_RE.search(software_name)
                 version = version_match.group(1) if version_match else ''
                 
                 return {
@@ -1134,12 +2000,53 @@ class DeviceIdentifier:
         # First, identify basic device info
         device_info = self.identify_device(metadata)
         
+        return self._complete_device_profile(metadata, device_info, {})
+    
+    def create_device_profiles(self, metadata_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create device profiles for a batch of images.
+        
+        Devices are identified with identify_devices, and each distinct
+        software name is looked up once for the whole batch.
+        
+        Args:
+            metadata_list: Metadata dictionaries, one per image
+            
+        Returns:
+            List of device profile dictionaries, in the same order
+        """
+        software_infos = {}
+        
+        return [
+            self._complete_device_profile(metadata, device_info, software_infos)
+            for metadata, device_info in zip(metadata_list, self.identify_devices(metadata_list))
+        ]
+    
+    def _complete_device_profile(self, metadata: Dict[str, Any], device_info: Dict[str, Any],
+                                 software_infos: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Add software, camera settings and privacy details to identified device info.
+        
+        Args:
+            metadata: Dictionary containing image metadata
+            device_info: Result of identify_device for the metadata, updated in place
+            software_infos: get_software_info results by software name, shared
+                across a batch
+            
+        Returns:
+            Dictionary with device profile information
+        """
         # Get device type
         device_type = device_info.get('DeviceType', 'Unknown')
         
         # Add software information
-        if 'Software' in device_info:
-            software_info = self.get_software_info(device_info['Software'])
+        software = device_info.get('Software')
+        if software is not None:
+            software_info = software_infos.get(software)
+            if software_info is None:
+                software_info = self.get_software_info(software)
+                software_infos[software] = software_info
+            
             # Only add new information
             for key, value in software_info.items():
                 if key not in device_info:
@@ -1169,118 +2076,51 @@ class DeviceIdentifier:
         """
         settings = {}
         
-        # Common camera settings to extract
-        setting_keys = {
-            'FNumber': 'Aperture',
-            'ApertureValue': 'Aperture',
-            'FocalLength': 'FocalLength',
-            'FocalLengthIn35mmFormat': 'FocalLength35mm',
-            'ExposureTime': 'ExposureTime',
-            'ShutterSpeedValue': 'ShutterSpeed',
-            'ISOSpeedRatings': 'ISO',
-            'ISO': 'ISO',
-            'WhiteBalance': 'WhiteBalance',
-            'MeteringMode': 'MeteringMode',
-            'ExposureProgram': 'ExposureProgram',
-            'ExposureMode': 'ExposureMode',
-            'ExposureCompensation': 'ExposureCompensation',
-            'Flash': 'Flash',
-            'FlashMode': 'FlashMode',
-            'FocusMode': 'FocusMode',
-            'DigitalZoomRatio': 'DigitalZoom'
-        }
+        # Take each setting from its highest-priority key variant
+        found = {}
+        for key in _CAMERA_SETTING_KEY_MAP.keys() & metadata.keys():
+            value = metadata[key]
+            if value is None:
+                continue
+            exif_key, priority = _CAMERA_SETTING_KEY_MAP[key]
+            if exif_key not in found or priority < found[exif_key][0]:
+                found[exif_key] = (priority, value)
         
         # Check for each setting in metadata
-        for exif_key, setting_name in setting_keys.items():
-            # Try different variations of the key
-            possible_keys = [
-                exif_key,
-                f'EXIF:{exif_key}',
-                f'MakerNotes:{exif_key}',
-                f'XMP:{exif_key}',
-                f'Image {exif_key}'
-            ]
+        for exif_key, setting_name in CAMERA_SETTING_KEYS.items():
+            if exif_key not in found:
+                continue
+            value = found[exif_key][1]
             
-            for key in possible_keys:
-                if key in metadata and metadata[key] is not None:
-                    value = metadata[key]
-                    
-                    # Format specific values
-                    if setting_name == 'Aperture' and isinstance(value, (int, float)):
-                        settings[setting_name] = f"f/{value}"
-                    elif setting_name == 'FocalLength' and isinstance(value, (int, float)):
-                        settings[setting_name] = f"{value}mm"
-                    elif setting_name == 'ExposureTime' and isinstance(value, (int, float)):
-                        if value < 1:
-                            # Convert to fraction (e.g., 0.5 -> 1/2)
-                            denominator = round(1 / value)
-                            settings[setting_name] = f"1/{denominator}s"
-                        else:
-                            settings[setting_name] = f"{value}s"
-                    else:
-                        settings[setting_name] = value
-                    
-                    break
+            # Format specific values
+            if setting_name == 'Aperture' and isinstance(value, (int, float)):
+                settings[setting_name] = f"f/{value}"
+            elif setting_name == 'FocalLength' and isinstance(value, (int, float)):
+                settings[setting_name] = f"{value}mm"
+            elif setting_name == 'ExposureTime' and isinstance(value, (int, float)):
+                if value < 1:
+                    # Convert to fraction (e.g., 0.5 -> 1/2)
+                    denominator = round(1 / value)
+                    settings[setting_name] = f"1/{denominator}s"
+                else:
+                    settings[setting_name] = f"{value}s"
+            else:
+                settings[setting_name] = value
         
         # Process flash information
-        if 'Flash' in settings:
-            flash_value = settings['Flash']
-            if isinstance(flash_value, int) or (isinstance(flash_value, str) and flash_value.isdigit()):
-                flash_int = int(flash_value)
-                flash_descriptions = {
-                    0: "No Flash",
-                    1: "Flash Fired",
-                    5: "Flash Fired, Return not detected",
-                    7: "Flash Fired, Return detected",
-                    8: "On, Flash did not fire",
-                    9: "Flash Fired, Compulsory mode",
-                    13: "Flash Fired, Compulsory mode, Return not detected",
-                    15: "Flash Fired, Compulsory mode, Return detected",
-                    16: "Off, Flash did not fire",
-                    24: "Off, Flash did not fire, Return not detected",
-                    25: "Flash Fired, Auto mode",
-                    29: "Flash Fired, Auto mode, Return not detected",
-                    31: "Flash Fired, Auto mode, Return detected",
-                    32: "No flash function",
-                    65: "Flash Fired, Red-eye reduction",
-                    69: "Flash Fired, Red-eye reduction, Return not detected",
-                    71: "Flash Fired, Red-eye reduction, Return detected",
-                    73: "Flash Fired, Compulsory mode, Red-eye reduction",
-                    77: "Flash Fired, Compulsory mode, Red-eye reduction, Return not detected",
-                    79: "Flash Fired, Compulsory mode, Red-eye reduction, Return detected",
-                    89: "Flash Fired, Auto mode, Red-eye reduction",
-                    93: "Flash Fired, Auto mode, Red-eye reduction, Return not detected",
-                    95: "Flash Fired, Auto mode, Red-eye reduction, Return detected"
-                }
-                settings['Flash'] = flash_descriptions.get(flash_int, f"Unknown ({flash_int})")
+        flash_int = _exif_code(settings.get('Flash'))
+        if flash_int is not None:
+            settings['Flash'] = FLASH_DESCRIPTIONS.get(flash_int, f"Unknown ({flash_int})")
         
         # Process metering mode
-        if 'MeteringMode' in settings:
-            metering_value = settings['MeteringMode']
-            if isinstance(metering_value, int) or (isinstance(metering_value, str) and metering_value.isdigit()):
-                metering_int = int(metering_value)
-                metering_modes = {
-                    0: "Unknown",
-                    1: "Average",
-                    2: "Center-weighted average",
-                    3: "Spot",
-                    4: "Multi-spot",
-                    5: "Pattern",
-                    6: "Partial",
-                    255: "Other"
-                }
-                settings['MeteringMode'] = metering_modes.get(metering_int, f"Unknown ({metering_int})")
+        metering_int = _exif_code(settings.get('MeteringMode'))
+        if metering_int is not None:
+            settings['MeteringMode'] = METERING_MODES.get(metering_int, f"Unknown ({metering_int})")
         
         # Process white balance
-        if 'WhiteBalance' in settings:
-            wb_value = settings['WhiteBalance']
-            if isinstance(wb_value, int) or (isinstance(wb_value, str) and wb_value.isdigit()):
-                wb_int = int(wb_value)
-                wb_modes = {
-                    0: "Auto",
-                    1: "Manual"
-                }
-                settings['WhiteBalance'] = wb_modes.get(wb_int, f"Unknown ({wb_int})")
+        wb_int = _exif_code(settings.get('WhiteBalance'))
+        if wb_int is not None:
+            settings['WhiteBalance'] = WHITE_BALANCE_MODES.get(wb_int, f"Unknown ({wb_int})")
         
         return settings
     
@@ -1301,94 +2141,60 @@ class DeviceIdentifier:
             'Recommendations': []
         }
         
-        sensitive_fields = []
-        
-        # Check for GPS data
-        has_gps = False
-        gps_keys = ['GPS:GPSLatitude', 'GPS:GPSLongitude', 'GPSLatitude', 'GPSLongitude', 'Latitude', 'Longitude']
-        for key in gps_keys:
-            if key in metadata and metadata[key] is not None:
-                has_gps = True
-                sensitive_fields.append('GPS Location')
-                break
-        
-        if has_gps:
+        # Find every kind of sensitive data in one pass over the metadata;
+        # device identifiers are matched by substring, so phones and tablets
+        # need every key, other devices only the known ones
+        check_device_id = device_type in ['Smartphone', 'Tablet']
+        if check_device_id:
+            keys = metadata.keys()
+        else:
+            keys = PRIVACY_FIELD_KEYS.keys() & metadata.keys()
+        
+        found = set()
+        for key in keys:
+            value = metadata[key]
+            field = PRIVACY_FIELD_KEYS.get(key)
+            if field is not None and field not in found:
+                # GPS coordinates of 0 are still a location
+                if value is not None if field == 'GPS Location' else value:
+                    found.add(field)
+            if check_device_id and value and _DEVICE_ID_KEY_RE.search(key):
+                found.add('Device Identifier')
+        
+        sensitive_fields = [field for field in PRIVACY_FIELDS if field in found]
+        
+        if 'GPS Location' in found:
             assessment['Recommendations'].append("Remove GPS data to protect location privacy")
             assessment['SensitiveDataPresent'] = True
             assessment['PrivacyRisk'] = 'High'
         
-        # Check for serial numbers
-        has_serial = False
-        serial_keys = ['SerialNumber', 'CameraSerialNumber', 'BodySerialNumber', 'LensSerialNumber']
-        for key in serial_keys:
-            if key in metadata and metadata[key]:
-                has_serial = True
-                sensitive_fields.append('Serial Number')
-                break
-        
-        if has_serial:
+        if 'Serial Number' in found:
             assessment['Recommendations'].append("Remove serial numbers to prevent device tracking")
             assessment['SensitiveDataPresent'] = True
             if assessment['PrivacyRisk'] != 'High':
                 assessment['PrivacyRisk'] = 'Medium'
         
-        # Check for owner information
-        has_owner_info = False
-        owner_keys = ['OwnerName', 'CameraOwnerName', 'Artist', 'Author', 'Creator', 'By-line']
-        for key in owner_keys:
-            if key in metadata and metadata[key]:
-                has_owner_info = True
-                sensitive_fields.append('Owner/Author Information')
-                break
-        
-        if has_owner_info:
+        if 'Owner/Author Information' in found:
             assessment['Recommendations'].append("Remove owner/author information for anonymity")
             assessment['SensitiveDataPresent'] = True
             if assessment['PrivacyRisk'] != 'High':
                 assessment['PrivacyRisk'] = 'Medium'
         
-        # Check for unique identifiers in smartphones
-        if device_type in ['Smartphone', 'Tablet']:
-            has_device_id = False
-            device_id_keys = ['DeviceID', 'UniqueID', 'IMEI', 'UUID']
-            for key in metadata:
-                if any(id_key in key for id_key in device_id_keys) and metadata[key]:
-                    has_device_id = True
-                    sensitive_fields.append('Device Identifier')
-                    break
-            
-            if has_device_id:
-                assessment['Recommendations'].append("Remove unique device identifiers")
-                assessment['SensitiveDataPresent'] = True
-                if assessment['PrivacyRisk'] != 'High':
-                    assessment['PrivacyRisk'] = 'Medium'
-        
-        # Check for timestamps
-        has_timestamp = False
-        timestamp_keys = ['DateTimeOriginal', 'CreateDate', 'ModifyDate', 'DateCreated']
-        for key in timestamp_keys:
-            if key in metadata and metadata[key]:
-                has_timestamp = True
-                sensitive_fields.append('Timestamp')
-                break
-        
-        if has_timestamp:
+        if 'Device Identifier' in found:
+            assessment['Recommendations'].append("Remove unique device identifiers")
+            assessment['SensitiveDataPresent'] = True
+            if assessment['PrivacyRisk'] != 'High':
+                assessment['PrivacyRisk'] = 'Medium'
+        
+        if 'Timestamp' in found:
             assessment['Recommendations'].append("Consider removing timestamps if time information is sensitive")
             # Timestamps alone are low risk
             if not assessment['SensitiveDataPresent']:
                 assessment['SensitiveDataPresent'] = True
                 assessment['PrivacyRisk'] = 'Low'
         
-        # Check for software information that might reveal workflow
-        has_software_info = False
-        software_keys = ['Software', 'ProcessingSoftware', 'CreatorTool']
-        for key in software_keys:
-            if key in metadata and metadata[key]:
-                has_software_info = True
-                sensitive_fields.append('Software Information')
-                break
-        
-        if has_software_info:
+        # Software information might reveal workflow
+        if 'Software Information' in found:
             assessment['Recommendations'].append("Consider removing software information to hide workflow details")
             # Software info alone is low risk
             if not assessment['SensitiveDataPresent']:
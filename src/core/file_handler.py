@@ -5,52 +5,351 @@ This module provides functionality for file operations, including loading images
 saving extracted metadata to various formats, and managing recent files.
 """
 
+import io
 import os
 import sys
+import stat
+import time
+import math
+import mmap
+import functools
+import contextlib
+import importlib.util
+import threading
+import concurrent.futures
+import atexit
+import weakref
 import json
 import csv
 import logging
-import tempfile
-import shutil
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union, BinaryIO, TextIO, Tuple
+from operator import itemgetter
+from html import escape as html_escape
+from typing import Dict, Any, List, Optional, Union, BinaryIO, TextIO, Tuple, Iterator
 import re
 
+from .constants import METADATA_CATEGORY_ORDER, make_metadata_categorizer
+
 # Get the package logger
 logger = logging.getLogger(__name__)
 
+# Extensions of files that is_valid_image accepts
+VALID_IMAGE_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp', '.heic', '.heif'
+})
+
+# MIME types by extension, used when python-magic is not installed
+MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.bmp': 'image/bmp',
+    '.tiff': 'image/tiff',
+    '.tif': 'image/tiff',
+    '.webp': 'image/webp',
+    '.heic': 'image/heic',
+    '.heif': 'image/heif',
+}
+
+# File size units with their size in bytes, one per power of 1024
+FILE_SIZE_UNITS = (
+    ('bytes', 1),
+    ('KB', 1024),
+    ('MB', 1024 ** 2),
+    ('GB', 1024 ** 3),
+)
+
+# Stylesheet lines of HTML reports
+HTML_REPORT_CSS = (
+    "        body { font-family: Arial, sans-serif; margin: 20px; }",
+    "        h1 { color: #2c3e50; }",
+    "        h2 { color: #3498db; margin-top: 20px; }",
+    "        .metadata-section { margin-bottom: 20px; }",
+    "        .metadata-table { border-collapse: collapse; width: 100%; margin-bottom: 20px; }",
+    "        .metadata-table th, .metadata-table td { border: 1px solid #ddd; padding: 8px; text-align: left; }",
+    "        .metadata-table th { background-color: #f2f2f2; width: 30%; }",
+    "        .metadata-table tr:nth-child(even) { background-color: #f9f9f9; }",
+    "        .image-preview { max-width: 500px; max-height: 500px; margin-bottom: 20px; }",
+    "        .timestamp { color: #7f8c8d; font-size: 0.9em; margin-top: 10px; }",
+    "        .footer { margin-top: 30px; border-top: 1px solid #eee; padding-top: 10px; color: #7f8c8d; font-size: 0.9em; }",
+    "        .risk-low { color: green; }",
+    "        .risk-medium { color: orange; }",
+    "        .risk-high { color: red; }",
+)
+
+# Table row of an HTML report, filled with the header and value cells
+HTML_TABLE_ROW = "            <tr><th>%s</th><td>%s</td></tr>"
+
+# Seconds to wait after a recent file is added before saving the list, so
+# that opening many files at once saves it only once
+RECENT_FILES_SAVE_DELAY = 2.0
+
+# Format of the timestamps reported by get_file_info
+FILE_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Buffer size for exports that are written in many small pieces
+EXPORT_BUFFER_SIZE = 128 * 1024
+
+# Number of bytes get_file_hash passes to the hash function at a time
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Save method for each output format; reports also take the image path
+EXPORT_METHODS = {
+    'csv': 'save_csv',
+    'json': 'save_json',
+    'txt': 'save_text',
+    'xlsx': 'save_excel',
+    'pdf': 'save_pdf',
+    'html': 'save_html',
+    'yaml': 'save_yaml',
+    'yml': 'save_yaml',
+}
+REPORT_FORMATS = frozenset({'pdf', 'html'})
+
+# Maximum number of formats save_all writes at the same time
+EXPORT_MAX_WORKERS = 4
+
+# Default number of files batch_process works on at the same time; callers
+# opt in to concurrency, since their metadata extractor must be thread-safe
+BATCH_MAX_WORKERS = 1
+
+# Report category of a metadata key; any key starting with EXIF, IPTC
+# or XMP is categorized by that prefix
+_metadata_category = make_metadata_categorizer(r'(GPS)|(EXIF)|(IPTC)|(XMP)')
+
 # Try to import optional dependencies with fallbacks
 try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    logger.info("pandas library not available. Excel export will be limited.")
-    PANDAS_AVAILABLE = False
+    logger.info("orjson library not available. Using the standard json module for recent files.")
+    ORJSON_AVAILABLE = False
 
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as RLImage
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    REPORTLAB_AVAILABLE = True
-except ImportError:
+# openpyxl, reportlab, PyYAML and PIL are only looked up here; the methods
+# that need them import them on first use, so creating a FileHandler does
+# not load them
+OPENPYXL_AVAILABLE = importlib.util.find_spec('openpyxl') is not None
+if not OPENPYXL_AVAILABLE:
+    logger.info("openpyxl library not available. Excel export will be limited.")
+
+REPORTLAB_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+if not REPORTLAB_AVAILABLE:
     logger.info("reportlab library not available. PDF export will be limited.")
-    REPORTLAB_AVAILABLE = False
 
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
+YAML_AVAILABLE = importlib.util.find_spec('yaml') is not None
+if not YAML_AVAILABLE:
     logger.info("PyYAML library not available. YAML export will be limited.")
-    YAML_AVAILABLE = False
 
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
+if not PIL_AVAILABLE:
     logger.info("PIL/Pillow library not available. Image preview in reports will be limited.")
-    PIL_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=1)
+def _get_mime_detector():
+    """
+    Get a shared python-magic MIME detector.
+    
+    Creating one loads the magic database, so it is done once and only
+    when a MIME type is first needed.
+    
+    Returns:
+        magic.Magic instance, or None if python-magic is not installed
+    """
+    try:
+        import magic
+    except ImportError:
+        return None
+    return magic.Magic(mime=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pdf_table_styles():
+    """
+    Get the table styles shared by every PDF report.
+    
+    Returns:
+        Tuple of (file information style, metadata table style)
+    """
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    
+    info_style = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ])
+    metadata_style = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ])
+    return info_style, metadata_style
+
+
+# Read buffers of get_file_hash, one per thread
+_hash_buffers = threading.local()
+
+
+def _get_hash_buffer() -> memoryview:
+    """
+    Get the calling thread's reusable get_file_hash read buffer.
+    
+    Returns:
+        Writable view of a HASH_CHUNK_SIZE byte buffer
+    """
+    buffer = getattr(_hash_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _hash_buffers.buffer = memoryview(bytearray(HASH_CHUNK_SIZE))
+    return buffer
+
+
+@contextlib.contextmanager
+def _atomic_open(path: str, mode: str = 'w', **kwargs) -> Iterator[Any]:
+    """
+    Open a temporary file that replaces path once it is closed.
+    
+    The temporary file is created next to path and moved into place with
+    os.replace only if the block completes, so readers never see a
+    partially written file and a failed export leaves any previous file
+    untouched.
+    
+    Args:
+        path: Path of the file to write
+        mode: File mode to open the temporary file with
+        **kwargs: Additional arguments for open()
+        
+    Yields:
+        The open temporary file
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """
+    Check whether serializable data contains NaN or an infinity.
+    
+    orjson writes those as null, so data containing them is left to the
+    json module.
+    
+    Args:
+        obj: Data returned by FileHandler._make_serializable
+        
+    Returns:
+        True if any float in the data is not finite, False otherwise
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def _get_import_formats() -> Tuple[str, ...]:
+    """
+    Get the image formats that can be imported.
+    
+    Probing PIL's features is not free, so it is done once.
+    
+    Returns:
+        Tuple of supported file extensions
+    """
+    import_formats = ('.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp')
+    
+    # Add HEIC/HEIF if PIL supports it
+    if PIL_AVAILABLE:
+        try:
+            from PIL import features
+            if features.check('libjpeg_turbo'):
+                import_formats += ('.heic', '.heif')
+        except (ImportError, AttributeError):
+            pass
+    
+    return import_formats
+
+
+@functools.lru_cache(maxsize=256)
+def _verify_image(file_path: str, mtime_ns: int, size: int) -> bool:
+    """
+    Check that PIL can open and verify an image file.
+    
+    The file is memory-mapped, so only the pages PIL reads are loaded.
+    The modification time and size are part of the cache key, so a changed
+    file is verified again. Errors opening or mapping the file are raised
+    rather than returned, so transient failures are not cached.
+    
+    Args:
+        file_path: Absolute path to the file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        True if the file is a valid image, False otherwise
+        
+    Raises:
+        OSError: If the file cannot be opened or mapped
+    """
+    from PIL import Image
+    
+    with open(file_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped and are never valid images
+            return False
+        
+        with mm:
+            # verify() reads only parts of the file, so skip read-ahead
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_RANDOM'):
+                mm.madvise(mmap.MADV_RANDOM)
+            
+            try:
+                with Image.open(mm) as img:
+                    # Check if the image can be loaded
+                    img.verify()
+            except Exception:
+                return False
+    return True
+
+
+# Handlers whose unsaved recent files are written at exit; held weakly so
+# that registering does not keep a handler alive
+_live_handlers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_handlers() -> None:
+    """Save the recent files of every live FileHandler with unsaved changes."""
+    for handler in list(_live_handlers):
+        handler.flush_recent_files()
 
 
 class FileHandler:
@@ -72,6 +371,12 @@ class FileHandler:
         self.recent_files = self._load_recent_files()
         self.config_dir = self._get_config_dir()
         
+        # Changes to the recent files list are saved in batches
+        self._recent_files_lock = threading.Lock()
+        self._recent_files_dirty = False
+        self._recent_files_timer = None
+        _live_handlers.add(self)
+        
         # Create config directory if it doesn't exist
         if not os.path.exists(self.config_dir):
             try:
@@ -109,17 +414,21 @@ class FileHandler:
             config_dir = self._get_config_dir()
             recent_files_path = os.path.join(config_dir, 'recent_files.json')
             
-            if os.path.exists(recent_files_path):
-                with open(recent_files_path, 'r', encoding='utf-8') as f:
-                    recent_files = json.load(f)
-                
-                # Filter out files that no longer exist
-                recent_files = [f for f in recent_files if os.path.exists(f)]
-                
-                logger.debug(f"Loaded {len(recent_files)} recent files")
-                return recent_files
+            try:
+                with open(recent_files_path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                return []
             
-            return []
+            recent_files = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            
+            # Filter out files that no longer exist; the list is capped at
+            # max_recent_files, so a stat per entry is cheaper than
+            # listing whole photo directories
+            recent_files = [f for f in recent_files if os.path.exists(f)]
+            
+            logger.debug(f"Loaded {len(recent_files)} recent files")
+            return recent_files
             
         except Exception as e:
             logger.warning(f"Failed to load recent files: {e}")
@@ -133,10 +442,30 @@ class FileHandler:
             True if successful, False otherwise
         """
         try:
+            import tempfile
+            
             recent_files_path = os.path.join(self.config_dir, 'recent_files.json')
             
-            with open(recent_files_path, 'w', encoding='utf-8') as f:
-                json.dump(self.recent_files, f, indent=2)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self.recent_files)
+            else:
+                data = json.dumps(self.recent_files, separators=(',', ':')).encode('utf-8')
+            
+            # Write to a temporary file next to the list and move it into
+            # place, so an interrupted save never leaves a truncated list
+            fd, temp_path = tempfile.mkstemp(dir=self.config_dir, prefix='.recent_files_', suffix='.json')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, recent_files_path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
             
             logger.debug(f"Saved {len(self.recent_files)} recent files")
             return True
@@ -158,19 +487,42 @@ class FileHandler:
         # Convert to absolute path
         file_path = os.path.abspath(file_path)
         
-        # Remove if already in the list
-        if file_path in self.recent_files:
-            self.recent_files.remove(file_path)
-        
-        # Add to the beginning of the list
-        self.recent_files.insert(0, file_path)
-        
-        # Trim the list if needed
-        if len(self.recent_files) > self.max_recent_files:
-            self.recent_files = self.recent_files[:self.max_recent_files]
+        with self._recent_files_lock:
+            # Remove if already in the list
+            if file_path in self.recent_files:
+                self.recent_files.remove(file_path)
+            
+            # Add to the beginning of the list
+            self.recent_files.insert(0, file_path)
+            
+            # Trim the list if needed
+            if len(self.recent_files) > self.max_recent_files:
+                self.recent_files = self.recent_files[:self.max_recent_files]
+            
+            # Save the updated list once a burst of additions is over
+            self._recent_files_dirty = True
+            if self._recent_files_timer is None:
+                self._recent_files_timer = threading.Timer(RECENT_FILES_SAVE_DELAY, self.flush_recent_files)
+                self._recent_files_timer.daemon = True
+                self._recent_files_timer.start()
+    
+    def flush_recent_files(self) -> bool:
+        """
+        Save the list of recent files if it has unsaved changes.
         
-        # Save the updated list
-        self._save_recent_files()
+        Returns:
+            True if the list is saved, False otherwise
+        """
+        with self._recent_files_lock:
+            if self._recent_files_timer is not None:
+                self._recent_files_timer.cancel()
+                self._recent_files_timer = None
+            
+            if not self._recent_files_dirty:
+                return True
+            
+            self._recent_files_dirty = False
+            return self._save_recent_files()
     
     def get_recent_files(self) -> List[str]:
         """
@@ -183,8 +535,10 @@ class FileHandler:
     
     def clear_recent_files(self) -> None:
         """Clear the list of recent files."""
-        self.recent_files = []
-        self._save_recent_files()
+        with self._recent_files_lock:
+            self.recent_files = []
+            self._recent_files_dirty = True
+        self.flush_recent_files()
         logger.info("Cleared recent files list")
     
     def is_valid_image(self, file_path: str) -> bool:
@@ -197,24 +551,26 @@ class FileHandler:
         Returns:
             True if the file is a valid image, False otherwise
         """
-        if not os.path.exists(file_path) or not os.path.isfile(file_path):
+        try:
+            file_stat = os.stat(file_path)
+        except (OSError, ValueError):
+            return False
+        
+        if not stat.S_ISREG(file_stat.st_mode):
             return False
         
         # Check file extension
         _, ext = os.path.splitext(file_path)
-        valid_extensions = ['.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp', '.heic', '.heif']
         
-        if ext.lower() not in valid_extensions:
+        if ext.lower() not in VALID_IMAGE_EXTENSIONS:
             return False
         
-        # Try to open with PIL if available
+        # Try to open with PIL if available; the result is reused until the
+        # file changes
         if PIL_AVAILABLE:
             try:
-                with Image.open(file_path) as img:
-                    # Check if the image can be loaded
-                    img.verify()
-                return True
-            except Exception:
+                return _verify_image(os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+            except OSError:
                 return False
         
         # If PIL is not available, just check the extension
@@ -230,43 +586,31 @@ class FileHandler:
         Returns:
             Dictionary with file information
         """
-        if not os.path.exists(file_path):
+        try:
+            file_stat = os.stat(file_path)
+        except (OSError, ValueError):
             return {'error': 'File not found'}
         
         try:
-            file_stat = os.stat(file_path)
+            ext = os.path.splitext(file_path)[1].lower()
             file_info = {
                 'filename': os.path.basename(file_path),
                 'path': os.path.abspath(file_path),
                 'size': file_stat.st_size,
                 'size_formatted': self._format_file_size(file_stat.st_size),
-                'created': datetime.fromtimestamp(file_stat.st_ctime).strftime('%Y-%m-%d %H:%M:%S'),
-                'modified': datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'accessed': datetime.fromtimestamp(file_stat.st_atime).strftime('%Y-%m-%d %H:%M:%S'),
-                'extension': os.path.splitext(file_path)[1].lower(),
+                'created': time.strftime(FILE_TIME_FORMAT, time.localtime(file_stat.st_ctime)),
+                'modified': time.strftime(FILE_TIME_FORMAT, time.localtime(file_stat.st_mtime)),
+                'accessed': time.strftime(FILE_TIME_FORMAT, time.localtime(file_stat.st_atime)),
+                'extension': ext,
             }
             
             # Get MIME type if python-magic is available
-            try:
-                import magic
-                mime = magic.Magic(mime=True)
+            mime = _get_mime_detector()
+            if mime is not None:
                 file_info['mime_type'] = mime.from_file(file_path)
-            except ImportError:
+            else:
                 # Fallback to basic MIME type detection
-                ext = os.path.splitext(file_path)[1].lower()
-                mime_types = {
-                    '.jpg': 'image/jpeg',
-                    '.jpeg': 'image/jpeg',
-                    '.png': 'image/png',
-                    '.gif': 'image/gif',
-                    '.bmp': 'image/bmp',
-                    '.tiff': 'image/tiff',
-                    '.tif': 'image/tiff',
-                    '.webp': 'image/webp',
-                    '.heic': 'image/heic',
-                    '.heif': 'image/heif',
-                }
-                file_info['mime_type'] = mime_types.get(ext, 'application/octet-stream')
+                file_info['mime_type'] = MIME_TYPES.get(ext, 'application/octet-stream')
             
             return file_info
             
@@ -284,14 +628,13 @@ class FileHandler:
         Returns:
             Formatted file size string
         """
-        if size_bytes < 1024:
+        # Every 10 bits of the size is one 1024x unit
+        tier = min(max(size_bytes.bit_length() - 1, 0) // 10, len(FILE_SIZE_UNITS) - 1)
+        if tier == 0:
             return f"{size_bytes} bytes"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+        
+        unit, divisor = FILE_SIZE_UNITS[tier]
+        return f"{size_bytes / divisor:.1f} {unit}"
     
     def save_csv(self, metadata: Dict[str, Any], output_file: str) -> bool:
         """
@@ -305,18 +648,14 @@ class FileHandler:
             True if successful, False otherwise
         """
         try:
-            # Flatten nested dictionaries
-            flattened_metadata = self._flatten_dict(metadata)
-            
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            with _atomic_open(output_file, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 
                 # Write header
                 writer.writerow(['Property', 'Value'])
                 
-                # Write data
-                for key, value in flattened_metadata.items():
-                    writer.writerow([key, value])
+                # Write data; colliding flattened keys keep the last value
+                writer.writerows(self._flatten_dict(metadata).items())
             
             logger.info(f"Saved metadata to CSV: {output_file}")
             return True
@@ -337,11 +676,10 @@ class FileHandler:
             True if successful, False otherwise
         """
         try:
-            # Convert non-serializable objects to strings
-            serializable_metadata = self._make_serializable(metadata)
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(serializable_metadata, f, indent=2, ensure_ascii=False)
+            # Non-serializable objects are converted while encoding, so the
+            # metadata is not copied first
+            with _atomic_open(output_file, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                json.dump(metadata, f, indent=2, ensure_ascii=False, default=self._json_default)
             
             logger.info(f"Saved metadata to JSON: {output_file}")
             return True
@@ -362,19 +700,15 @@ class FileHandler:
             True if successful, False otherwise
         """
         try:
-            # Flatten nested dictionaries
-            flattened_metadata = self._flatten_dict(metadata)
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with _atomic_open(output_file, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 f.write("IMAGE METADATA REPORT\n")
                 f.write("=" * 50 + "\n\n")
                 
                 # Add timestamp
                 f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
                 
-                # Write data
-                for key, value in flattened_metadata.items():
-                    f.write(f"{key}: {value}\n")
+                # Write data; colliding flattened keys keep the last value
+                f.writelines(f"{key}: {value}\n" for key, value in self._flatten_dict(metadata).items())
             
             logger.info(f"Saved metadata to text file: {output_file}")
             return True
@@ -394,34 +728,17 @@ class FileHandler:
         Returns:
             True if successful, False otherwise
         """
-        if not PANDAS_AVAILABLE:
-            logger.error("pandas library not available. Cannot save to Excel.")
+        if not OPENPYXL_AVAILABLE:
+            logger.error("openpyxl library not available. Cannot save to Excel.")
             return False
         
         try:
             # Flatten nested dictionaries
             flattened_metadata = self._flatten_dict(metadata)
             
-            # Create DataFrame
-            df = pd.DataFrame(list(flattened_metadata.items()), columns=['Property', 'Value'])
-            
-            # Save to Excel
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Metadata', index=False)
-                
-                # Auto-adjust column widths
-                worksheet = writer.sheets['Metadata']
-                for i, col in enumerate(['A', 'B']):
-                    max_length = 0
-                    column = worksheet[col]
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = (max_length + 2)
-                    worksheet.column_dimensions[col].width = min(adjusted_width, 100)
+            # A two-column table needs no DataFrame; stream the rows straight
+            # into a write-only workbook
+            self._save_excel_write_only(flattened_metadata, output_file)
             
             logger.info(f"Saved metadata to Excel: {output_file}")
             return True
@@ -430,6 +747,39 @@ class FileHandler:
             logger.error(f"Error saving metadata to Excel: {e}")
             return False
     
+    def _save_excel_write_only(self, flattened_metadata: Dict[str, Any], output_file: str) -> None:
+        """
+        Save flattened metadata to an Excel file with an openpyxl write-only workbook.
+        
+        Rows are streamed to the file as they are appended, so memory use
+        does not grow with the number of rows.
+        
+        Args:
+            flattened_metadata: Flattened metadata dictionary
+            output_file: Path to the output file
+        """
+        # Excel cannot hold lists and other objects, so write them as text
+        rows = [
+            (key, value if value is None or isinstance(value, (str, int, float, datetime)) else str(value))
+            for key, value in flattened_metadata.items()
+        ]
+        
+        import openpyxl
+        
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Metadata')
+        
+        # Column widths must be set before any row is written
+        for col, index, header in (('A', 0, 'Property'), ('B', 1, 'Value')):
+            max_length = max([len(header)] + [len(str(row[index])) for row in rows])
+            worksheet.column_dimensions[col].width = min(max_length + 2, 100)
+        
+        worksheet.append(['Property', 'Value'])
+        for row in rows:
+            worksheet.append(row)
+        
+        workbook.save(output_file)
+    
     def save_pdf(self, metadata: Dict[str, Any], output_file: str, **kwargs) -> bool:
         """
         Save metadata to a PDF file.
@@ -452,6 +802,14 @@ class FileHandler:
             return False
         
         try:
+            from reportlab.lib import colors
+            from reportlab.lib.pagesizes import letter, A4
+            from reportlab.lib.styles import getSampleStyleSheet
+            from reportlab.lib.units import inch
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Image as RLImage
+            
+            info_table_style, metadata_table_style = _get_pdf_table_styles()
+            
             # Get options
             image_path = kwargs.get('image_path', None)
             include_preview = kwargs.get('include_preview', True)
@@ -478,15 +836,6 @@ class FileHandler:
             heading_style = styles['Heading2']
             normal_style = styles['Normal']
             
-            # Create custom style for metadata
-            metadata_style = ParagraphStyle(
-                'MetadataStyle',
-                parent=styles['Normal'],
-                fontName='Courier',
-                fontSize=9,
-                leading=12
-            )
-            
             # Create content elements
             elements = []
             
@@ -511,35 +860,44 @@ class FileHandler:
                     elements.append(Paragraph("Image Preview", heading_style))
                     elements.append(Spacer(1, 0.1 * inch))
                     
-                    # Open and resize image for preview
-                    img = Image.open(image_path)
-                    
-                    # Calculate dimensions to fit on page
-                    max_width = page_dimensions[0] - 2 * 72  # Page width minus margins
-                    max_height = 3 * inch  # Limit height to 3 inches
+                    from PIL import Image
                     
-                    width, height = img.size
-                    aspect = width / height
-                    
-                    if width > max_width:
-                        width = max_width
-                        height = width / aspect
-                    
-                    if height > max_height:
-                        height = max_height
-                        width = height * aspect
-                    
-                    # Create temporary file for the image
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg') as temp_file:
-                        temp_filename = temp_file.name
-                    
-                    # Save resized image to temp file
-                    img_copy = img.copy()
-                    img_copy.thumbnail((int(width), int(height)), Image.LANCZOS)
-                    img_copy.save(temp_filename, format='JPEG')
+                    # Open and resize image for preview
+                    with Image.open(image_path) as img:
+                        # Calculate dimensions to fit on page
+                        max_width = page_dimensions[0] - 2 * 72  # Page width minus margins
+                        max_height = 3 * inch  # Limit height to 3 inches
+                        
+                        width, height = img.size
+                        aspect = width / height
+                        
+                        if width > max_width:
+                            width = max_width
+                            height = width / aspect
+                        
+                        if height > max_height:
+                            height = max_height
+                            width = height * aspect
+                        
+                        if img.format == 'JPEG' and img.size == (int(width), int(height)):
+                            # A JPEG that already fits is used as is, without
+                            # decoding and re-encoding it
+                            preview = image_path
+                        else:
+                            # Let the JPEG decoder downscale while decoding
+                            img.draft(img.mode, (int(width), int(height)))
+                            
+                            # The image is opened for this report only, so
+                            # resize it in place instead of decoding a copy
+                            img.thumbnail((int(width), int(height)), Image.LANCZOS)
+                            
+                            # Keep the resized preview in memory
+                            preview = io.BytesIO()
+                            img.save(preview, format='JPEG')
+                            preview.seek(0)
                     
                     # Add image to PDF
-                    elements.append(RLImage(temp_filename, width=width, height=height))
+                    elements.append(RLImage(preview, width=width, height=height))
                     elements.append(Spacer(1, 0.25 * inch))
                     
                 except Exception as e:
@@ -570,15 +928,7 @@ class FileHandler:
                 # Create table for file info
                 if file_info:
                     table = Table(file_info, colWidths=[1.5 * inch, 4 * inch])
-                    table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                        ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 10),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ]))
+                    table.setStyle(info_table_style)
                     elements.append(table)
                     elements.append(Spacer(1, 0.25 * inch))
             
@@ -607,16 +957,7 @@ class FileHandler:
                 # Create table
                 if table_data:
                     table = Table(table_data, colWidths=[2.5 * inch, 3 * inch])
-                    table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                        ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ]))
+                    table.setStyle(metadata_table_style)
                     elements.append(table)
                     elements.append(Spacer(1, 0.25 * inch))
             
@@ -650,15 +991,7 @@ class FileHandler:
                 # Create table
                 if privacy_data:
                     table = Table(privacy_data, colWidths=[2 * inch, 3.5 * inch])
-                    table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                        ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
-                        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 10),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ]))
+                    table.setStyle(info_table_style)
                     elements.append(table)
                     elements.append(Spacer(1, 0.15 * inch))
                 
@@ -682,13 +1015,6 @@ class FileHandler:
             # Build PDF
             doc.build(elements)
             
-            # Clean up temporary files
-            if include_preview and 'temp_filename' in locals():
-                try:
-                    os.unlink(temp_filename)
-                except:
-                    pass
-            
             logger.info(f"Saved metadata to PDF: {output_file}")
             return True
             
@@ -719,178 +1045,190 @@ class FileHandler:
             title = kwargs.get('title', 'Image Metadata Report')
             company_name = kwargs.get('company_name', '')
             
-            # Categorize metadata
-            categories = self._categorize_metadata(metadata)
+            # Stream the report into the file as it is generated
+            lines = self._iter_html_lines(
+                metadata, output_file, image_path, include_preview, title, company_name
+            )
+            with _atomic_open(output_file, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                write = f.write
+                write(next(lines))
+                for line in lines:
+                    write('\n')
+                    write(line)
             
-            # Start HTML content
-            html = [
-                "<!DOCTYPE html>",
-                "<html>",
-                "<head>",
-                f"    <title>{title}</title>",
-                "    <style>",
-                "        body { font-family: Arial, sans-serif; margin: 20px; }",
-                "        h1 { color: #2c3e50; }",
-                "        h2 { color: #3498db; margin-top: 20px; }",
-                "        .metadata-section { margin-bottom: 20px; }",
-                "        .metadata-table { border-collapse: collapse; width: 100%; margin-bottom: 20px; }",
-                "        .metadata-table th, .metadata-table td { border: 1px solid #ddd; padding: 8px; text-align: left; }",
-                "        .metadata-table th { background-color: #f2f2f2; width: 30%; }",
-                "        .metadata-table tr:nth-child(even) { background-color: #f9f9f9; }",
-                "        .image-preview { max-width: 500px; max-height: 500px; margin-bottom: 20px; }",
-                "        .timestamp { color: #7f8c8d; font-size: 0.9em; margin-top: 10px; }",
-                "        .footer { margin-top: 30px; border-top: 1px solid #eee; padding-top: 10px; color: #7f8c8d; font-size: 0.9em; }",
-                "        .risk-low { color: green; }",
-                "        .risk-medium { color: orange; }",
-                "        .risk-high { color: red; }",
-                "    </style>",
-                "</head>",
-                "<body>",
-                f"    <h1>{title}</h1>"
-            ]
+            logger.info(f"Saved metadata to HTML: {output_file}")
+            return True
             
-            # Add company name if provided
-            if company_name:
-                html.append(f"    <p>Prepared by: {company_name}</p>")
+        except Exception as e:
+            logger.error(f"Error saving metadata to HTML: {e}")
+            return False
+    
+    def _iter_html_lines(self, metadata: Dict[str, Any], output_file: str, image_path: Optional[str],
+                         include_preview: bool, title: str, company_name: str) -> Iterator[str]:
+        """
+        Generate the lines of an HTML report, without line endings.
+        
+        Args:
+            metadata: Dictionary containing metadata
+            output_file: Path to the output file, next to which a preview is saved
+            image_path: Path to the image for preview
+            include_preview: Whether to include image preview
+            title: Title for the report
+            company_name: Company name for the report header
             
-            # Add timestamp
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            html.append(f"    <p class='timestamp'>Generated: {timestamp}</p>")
+        Yields:
+            Lines of the HTML document
+        """
+        # Categorize metadata
+        categories = self._categorize_metadata(metadata)
+        
+        # Start HTML content
+        yield from (
+            "<!DOCTYPE html>",
+            "<html>",
+            "<head>",
+            f"    <title>{title}</title>",
+            "    <style>",
+            *HTML_REPORT_CSS,
+            "    </style>",
+            "</head>",
+            "<body>",
+            f"    <h1>{title}</h1>"
+        )
+        
+        # Add company name if provided
+        if company_name:
+            yield f"    <p>Prepared by: {company_name}</p>"
+        
+        # Add timestamp
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        yield f"    <p class='timestamp'>Generated: {timestamp}</p>"
+        
+        # Add image preview if available
+        if include_preview and image_path and os.path.exists(image_path):
+            yield "    <div class='metadata-section'>"
+            yield "        <h2>Image Preview</h2>"
             
-            # Add image preview if available
-            if include_preview and image_path and os.path.exists(image_path):
-                html.append("    <div class='metadata-section'>")
-                html.append("        <h2>Image Preview</h2>")
-                
-                # Create a copy of the image in the same directory as the HTML file
-                if PIL_AVAILABLE:
-                    try:
-                        # Create preview directory
-                        preview_dir = os.path.join(os.path.dirname(output_file), 'preview')
-                        os.makedirs(preview_dir, exist_ok=True)
-                        
-                        # Create preview filename
-                        preview_filename = os.path.join(preview_dir, f"preview_{os.path.basename(image_path)}")
-                        
-                        # Create preview image
-                        img = Image.open(image_path)
+            # Create a copy of the image in the same directory as the HTML file
+            if PIL_AVAILABLE:
+                try:
+                    # Create preview directory
+                    output_dir = os.path.dirname(output_file)
+                    preview_dir = os.path.join(output_dir, 'preview')
+                    os.makedirs(preview_dir, exist_ok=True)
+                    
+                    # Create preview filename
+                    preview_filename = os.path.join(preview_dir, f"preview_{os.path.basename(image_path)}")
+                    
+                    # Create preview image; the JPEG decoder downscales to about
+                    # twice the preview size, so the LANCZOS pass has less to do
+                    from PIL import Image
+                    with Image.open(image_path) as img:
+                        img.draft(img.mode, (1000, 1000))
                         img.thumbnail((500, 500), Image.LANCZOS)
                         img.save(preview_filename)
-                        
-                        # Add relative path to HTML
-                        rel_path = os.path.relpath(preview_filename, os.path.dirname(output_file))
-                        html.append(f"        <img src='{rel_path}' class='image-preview' alt='Image preview'>")
-                    except Exception as e:
-                        logger.warning(f"Error creating image preview for HTML: {e}")
-                        # Fallback to direct reference
-                        html.append(f"        <img src='file://{image_path.replace(' ', '%20')}' class='image-preview' alt='Image preview'>")
-                else:
-                    # Direct reference if PIL is not available
-                    html.append(f"        <img src='file://{image_path.replace(' ', '%20')}' class='image-preview' alt='Image preview'>")
-                
-                html.append("    </div>")
+                    
+                    # Add relative path to HTML
+                    rel_path = os.path.relpath(preview_filename, output_dir)
+                    yield f"        <img src='{rel_path}' class='image-preview' alt='Image preview'>"
+                except Exception as e:
+                    logger.warning(f"Error creating image preview for HTML: {e}")
+                    # Fallback to direct reference
+                    yield f"        <img src='file://{image_path.replace(' ', '%20')}' class='image-preview' alt='Image preview'>"
+            else:
+                # Direct reference if PIL is not available
+                yield f"        <img src='file://{image_path.replace(' ', '%20')}' class='image-preview' alt='Image preview'>"
             
-            # Add file information if available
-            if 'FileName' in metadata or 'FilePath' in metadata:
-                html.append("    <div class='metadata-section'>")
-                html.append("        <h2>File Information</h2>")
-                html.append("        <table class='metadata-table'>")
-                
-                if 'FileName' in metadata:
-                    html.append(f"            <tr><th>File Name</th><td>{metadata['FileName']}</td></tr>")
-                
-                if 'FilePath' in metadata:
-                    html.append(f"            <tr><th>File Path</th><td>{metadata['FilePath']}</td></tr>")
-                
-                if 'FileSize' in metadata and 'FileSizeFormatted' in metadata:
-                    html.append(f"            <tr><th>File Size</th><td>{metadata['FileSizeFormatted']}</td></tr>")
-                
-                if 'FileModifyDate' in metadata:
-                    html.append(f"            <tr><th>Modified</th><td>{metadata['FileModifyDate']}</td></tr>")
-                
-                if 'FileCreateDate' in metadata:
-                    html.append(f"            <tr><th>Created</th><td>{metadata['FileCreateDate']}</td></tr>")
-                
-                html.append("        </table>")
-                html.append("    </div>")
+            yield "    </div>"
+        
+        # Add file information if available
+        if 'FileName' in metadata or 'FilePath' in metadata:
+            yield "    <div class='metadata-section'>"
+            yield "        <h2>File Information</h2>"
+            yield "        <table class='metadata-table'>"
             
-            # Add each category
-            for category_name, category_data in categories.items():
-                if not category_data:
-                    continue
-                
-                html.append("    <div class='metadata-section'>")
-                html.append(f"        <h2>{category_name}</h2>")
-                html.append("        <table class='metadata-table'>")
-                
-                for key, value in category_data.items():
-                    # Format value
-                    if isinstance(value, (list, tuple)):
-                        value = ', '.join(str(item) for item in value)
-                    elif not isinstance(value, str):
-                        value = str(value)
-                    
-                    # Escape HTML special characters
-                    value = value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                    
-                    html.append(f"            <tr><th>{key}</th><td>{value}</td></tr>")
-                
-                html.append("        </table>")
-                html.append("    </div>")
+            if 'FileName' in metadata:
+                yield HTML_TABLE_ROW % ('File Name', html_escape(str(metadata['FileName']), quote=False))
             
-            # Add privacy assessment if available
-            if 'PrivacyAssessment' in metadata:
-                html.append("    <div class='metadata-section'>")
-                html.append("        <h2>Privacy Assessment</h2>")
-                html.append("        <table class='metadata-table'>")
-                
-                privacy = metadata['PrivacyAssessment']
-                
-                if 'PrivacyRisk' in privacy:
-                    risk_level = privacy['PrivacyRisk']
-                    risk_class = f"risk-{risk_level.lower()}"
-                    html.append(f"            <tr><th>Privacy Risk Level</th><td class='{risk_class}'>{risk_level}</td></tr>")
-                
-                if 'SensitiveDataPresent' in privacy:
-                    html.append(f"            <tr><th>Sensitive Data Present</th><td>{'Yes' if privacy['SensitiveDataPresent'] else 'No'}</td></tr>")
-                
-                if 'SensitiveFields' in privacy and privacy['SensitiveFields']:
-                    fields = ', '.join(privacy['SensitiveFields'])
-                    html.append(f"            <tr><th>Sensitive Fields</th><td>{fields}</td></tr>")
-                
-                html.append("        </table>")
-                
-                # Add recommendations
-                if 'Recommendations' in privacy and privacy['Recommendations']:
-                    html.append("        <h3>Recommendations:</h3>")
-                    html.append("        <ul>")
-                    
-                    for recommendation in privacy['Recommendations']:
-                        html.append(f"            <li>{recommendation}</li>")
-                    
-                    html.append("        </ul>")
+            if 'FilePath' in metadata:
+                yield HTML_TABLE_ROW % ('File Path', html_escape(str(metadata['FilePath']), quote=False))
+            
+            if 'FileSize' in metadata and 'FileSizeFormatted' in metadata:
+                yield HTML_TABLE_ROW % ('File Size', html_escape(str(metadata['FileSizeFormatted']), quote=False))
+            
+            if 'FileModifyDate' in metadata:
+                yield HTML_TABLE_ROW % ('Modified', html_escape(str(metadata['FileModifyDate']), quote=False))
+            
+            if 'FileCreateDate' in metadata:
+                yield HTML_TABLE_ROW % ('Created', html_escape(str(metadata['FileCreateDate']), quote=False))
+            
+            yield "        </table>"
+            yield "    </div>"
+        
+        # Add each category
+        for category_name, category_data in categories.items():
+            if not category_data:
+                continue
+            
+            yield "    <div class='metadata-section'>"
+            yield f"        <h2>{category_name}</h2>"
+            yield "        <table class='metadata-table'>"
+            
+            for key, value in category_data.items():
+                # Format value
+                if isinstance(value, (list, tuple)):
+                    value = ', '.join(str(item) for item in value)
+                elif not isinstance(value, str):
+                    value = str(value)
                 
-                html.append("    </div>")
+                # Escape HTML special characters
+                yield HTML_TABLE_ROW % (html_escape(key, quote=False), html_escape(value, quote=False))
             
-            # Add footer
-            html.append("    <div class='footer'>")
-            html.append("        Generated by Image Metadata Extractor")
-            html.append("    </div>")
+            yield "        </table>"
+            yield "    </div>"
+        
+        # Add privacy assessment if available
+        if 'PrivacyAssessment' in metadata:
+            yield "    <div class='metadata-section'>"
+            yield "        <h2>Privacy Assessment</h2>"
+            yield "        <table class='metadata-table'>"
             
-            # Close HTML
-            html.append("</body>")
-            html.append("</html>")
+            privacy = metadata['PrivacyAssessment']
             
-            # Write to file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(html))
+            if 'PrivacyRisk' in privacy:
+                risk_level = privacy['PrivacyRisk']
+                risk_class = f"risk-{risk_level.lower()}"
+                yield f"            <tr><th>Privacy Risk Level</th><td class='{risk_class}'>{risk_level}</td></tr>"
             
-            logger.info(f"Saved metadata to HTML: {output_file}")
-            return True
+            if 'SensitiveDataPresent' in privacy:
+                yield f"            <tr><th>Sensitive Data Present</th><td>{'Yes' if privacy['SensitiveDataPresent'] else 'No'}</td></tr>"
             
-        except Exception as e:
-            logger.error(f"Error saving metadata to HTML: {e}")
-            return False
+            if 'SensitiveFields' in privacy and privacy['SensitiveFields']:
+                fields = html_escape(', '.join(privacy['SensitiveFields']), quote=False)
+                yield HTML_TABLE_ROW % ('Sensitive Fields', fields)
+            
+            yield "        </table>"
+            
+            # Add recommendations
+            if 'Recommendations' in privacy and privacy['Recommendations']:
+                yield "        <h3>Recommendations:</h3>"
+                yield "        <ul>"
+                
+                for recommendation in privacy['Recommendations']:
+                    yield f"            <li>{html_escape(str(recommendation), quote=False)}</li>"
+                
+                yield "        </ul>"
+            
+            yield "    </div>"
+        
+        # Add footer
+        yield "    <div class='footer'>"
+        yield "        Generated by Image Metadata Extractor"
+        yield "    </div>"
+        
+        # Close HTML
+        yield "</body>"
+        yield "</html>"
     
     def save_yaml(self, metadata: Dict[str, Any], output_file: str) -> bool:
         """
@@ -908,11 +1246,17 @@ class FileHandler:
             return False
         
         try:
+            import yaml
+            
             # Convert non-serializable objects to strings
             serializable_metadata = self._make_serializable(metadata)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                yaml.dump(serializable_metadata, f, default_flow_style=False, sort_keys=False)
+            # Use the libyaml emitter when PyYAML was built with it
+            dumper = getattr(yaml, 'CDumper', yaml.Dumper)
+            
+            with _atomic_open(output_file, 'w', encoding='utf-8') as f:
+                yaml.dump(serializable_metadata, f, Dumper=dumper, default_flow_style=False,
+                          sort_keys=False, allow_unicode=True)
             
             logger.info(f"Saved metadata to YAML: {output_file}")
             return True
@@ -933,23 +1277,55 @@ class FileHandler:
         Returns:
             Flattened dictionary
         """
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            
-            if isinstance(v, dict) and v:
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            elif isinstance(v, (list, tuple)) and v and isinstance(v[0], dict):
-                # Handle list of dictionaries
-                for i, item in enumerate(v):
-                    if isinstance(item, dict):
-                        items.extend(self._flatten_dict(item, f"{new_key}[{i}]", sep=sep).items())
-                    else:
-                        items.append((f"{new_key}[{i}]", item))
-            else:
-                items.append((new_key, v))
+        return dict(self._iter_flattened(d, parent_key, sep))
+    
+    def _iter_flattened(self, d: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the (key, value) pairs of a nested dictionary, flattened.
+        
+        A nested key can flatten to the same name as a dotted key, e.g.
+        {'a': {'b': 1}, 'a.b': 2}, so a key may be yielded more than once;
+        _flatten_dict keeps the last value.
+        
+        Args:
+            d: Dictionary to flatten
+            parent_key: Parent key for nested dictionaries
+            sep: Separator for keys
+            
+        Yields:
+            Flattened (key, value) pairs, in the order _flatten_dict uses
+        """
+        # Walk the nesting with an explicit stack of (key prefix, items,
+        # whether the items come from a list) instead of nested generators,
+        # which pass every pair up through each level
+        stack = [(parent_key, iter(d.items()), False)]
         
-        return dict(items)
+        while stack:
+            prefix, items, in_list = stack[-1]
+            
+            for k, v in items:
+                if in_list:
+                    # Items of a list of dictionaries
+                    new_key = f"{prefix}[{k}]"
+                    if isinstance(v, dict):
+                        stack.append((new_key, iter(v.items()), False))
+                        break
+                    yield new_key, v
+                    continue
+                
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                
+                if isinstance(v, dict) and v:
+                    stack.append((new_key, iter(v.items()), False))
+                    break
+                elif isinstance(v, (list, tuple)) and v and isinstance(v[0], dict):
+                    # Handle list of dictionaries
+                    stack.append((new_key, enumerate(v), True))
+                    break
+                else:
+                    yield new_key, v
+            else:
+                stack.pop()
     
     def _make_serializable(self, obj: Any) -> Any:
         """
@@ -974,6 +1350,25 @@ class FileHandler:
         else:
             return str(obj)
     
+    def _json_default(self, obj: Any) -> Any:
+        """
+        Convert an object the JSON encoder cannot serialize.
+        
+        Gives the same output as _make_serializable, one object at a time.
+        
+        Args:
+            obj: Object to convert
+            
+        Returns:
+            Serializable object
+        """
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        elif hasattr(obj, '__dict__'):
+            return obj.__dict__
+        else:
+            return str(obj)
+    
     def _categorize_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
         Categorize metadata into logical groups.
@@ -984,82 +1379,41 @@ class FileHandler:
         Returns:
             Dictionary with categorized metadata
         """
-        categories = {
-            'Basic Information': {},
-            'Camera Information': {},
-            'Lens Information': {},
-            'Exposure Information': {},
-            'GPS Information': {},
-            'EXIF Data': {},
-            'IPTC Data': {},
-            'XMP Data': {},
-            'File Information': {},
-            'Other Metadata': {}
-        }
-        
-        # Skip these keys as they're handled separately
-        skip_keys = ['PrivacyAssessment']
+        # Only categories that receive a key are created
+        categories = defaultdict(dict)
         
         for key, value in metadata.items():
-            if key in skip_keys:
+            # Skip the privacy assessment as it's handled separately
+            if key == 'PrivacyAssessment':
                 continue
             
-            # File information
-            if key.startswith('File') or key in ['FileName', 'FilePath', 'FileSize', 'FileSizeFormatted']:
-                categories['File Information'][key] = value
-            
-            # Basic information
-            elif key in ['ImageWidth', 'ImageHeight', 'ImageSize', 'Megapixels', 'AspectRatio', 'ColorSpace', 'BitsPerPixel']:
-                categories['Basic Information'][key] = value
-            
-            # Camera information
-            elif key in ['Make', 'Model', 'DeviceMake', 'DeviceModel', 'DeviceType', 'Software', 'CameraSerialNumber', 'DeviceSerialNumber']:
-                categories['Camera Information'][key] = value
-            
-            # Lens information
-            elif 'Lens' in key or key in ['FocalLength', 'FocalLength35mm']:
-                categories['Lens Information'][key] = value
-            
-            # Exposure information
-            elif key in ['Aperture', 'ShutterSpeed', 'ISO', 'ExposureTime', 'ExposureProgram', 'ExposureMode', 'ExposureCompensation', 'MeteringMode', 'Flash', 'WhiteBalance']:
-                categories['Exposure Information'][key] = value
-            
-            # GPS information
-            elif key.startswith('GPS') or key in ['Latitude', 'Longitude', 'Altitude', 'Location', 'LocationName', 'City', 'State', 'Country']:
-                categories['GPS Information'][key] = value
-            
-            # EXIF data
-            elif key.startswith('EXIF:') or key.startswith('EXIF'):
-                categories['EXIF Data'][key] = value
-            
-            # IPTC data
-            elif key.startswith('IPTC:') or key.startswith('IPTC'):
-                categories['IPTC Data'][key] = value
-            
-            # XMP data
-            elif key.startswith('XMP:') or key.startswith('XMP'):
-                categories['XMP Data'][key] = value
-            
-            # Other metadata
-            else:
-                categories['Other Metadata'][key] = value
+            categories[_metadata_category(key)][key] = value
         
-        # Remove empty categories
-        return {k: v for k, v in categories.items() if v}
+        # Return the categories in report order
+        return {name: categories[name] for name in METADATA_CATEGORY_ORDER if name in categories}
     
-    def copy_file(self, source_path: str, dest_path: str) -> bool:
+    def copy_file(self, source_path: str, dest_path: str, preserve_metadata: bool = True) -> bool:
         """
         Copy a file from source to destination.
         
         Args:
             source_path: Path to the source file
             dest_path: Path to the destination file
+            preserve_metadata: Whether to copy permissions and timestamps too;
+                if False, dest_path must be a file path, not a directory
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            shutil.copy2(source_path, dest_path)
+            import shutil
+            
+            if preserve_metadata:
+                shutil.copy2(source_path, dest_path)
+            else:
+                # Only the contents, which the kernel copies directly
+                # where the platform supports it
+                shutil.copyfile(source_path, dest_path)
             logger.info(f"Copied file from {source_path} to {dest_path}")
             return True
         except Exception as e:
@@ -1077,6 +1431,8 @@ class FileHandler:
             Path to the backup file, or None if backup failed
         """
         try:
+            import shutil
+            
             # Create backup filename
             backup_dir = os.path.join(os.path.dirname(file_path), 'backups')
             os.makedirs(backup_dir, exist_ok=True)
@@ -1106,6 +1462,8 @@ class FileHandler:
             True if successful, False otherwise
         """
         try:
+            import shutil
+            
             shutil.copy2(backup_path, original_path)
             logger.info(f"Restored backup from {backup_path} to {original_path}")
             return True
@@ -1124,27 +1482,33 @@ class FileHandler:
             List of backup file paths
         """
         try:
+            import fnmatch
+            import glob
+            
             # Get backup directory
             backup_dir = os.path.join(os.path.dirname(file_path), 'backups')
-            if not os.path.exists(backup_dir):
-                return []
             
             # Get filename without extension
-            filename_base = os.path.splitext(os.path.basename(file_path))[0]
-            ext = os.path.splitext(file_path)[1]
+            filename_base, ext = os.path.splitext(os.path.basename(file_path))
             
-            # Find matching backups
-            pattern = re.compile(f"^{re.escape(filename_base)}_\\d{{8}}_\\d{{6}}{re.escape(ext)}$")
-            backups = []
+            # Backups are named <name>_YYYYMMDD_HHMMSS<ext>
+            pattern = f"{glob.escape(filename_base)}_{'[0-9]' * 8}_{'[0-9]' * 6}{glob.escape(ext)}"
             
-            for filename in os.listdir(backup_dir):
-                if pattern.match(filename):
-                    backups.append(os.path.join(backup_dir, filename))
+            # Find matching backups and their modification times in one
+            # pass over the directory
+            backups = []
+            try:
+                with os.scandir(backup_dir) as entries:
+                    for entry in entries:
+                        if fnmatch.fnmatchcase(entry.name, pattern):
+                            backups.append((entry.stat().st_mtime_ns, entry.path))
+            except FileNotFoundError:
+                return []
             
             # Sort by modification time (newest first)
-            backups.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+            backups.sort(key=itemgetter(0), reverse=True)
             
-            return backups
+            return [path for _, path in backups]
         except Exception as e:
             logger.error(f"Error listing backups: {e}")
             return []
@@ -1175,6 +1539,8 @@ class FileHandler:
             Path to the temporary directory, or None if creation failed
         """
         try:
+            import tempfile
+            
             temp_dir = tempfile.mkdtemp(prefix="image_metadata_extractor_")
             logger.debug(f"Created temporary directory: {temp_dir}")
             return temp_dir
@@ -1193,7 +1559,9 @@ class FileHandler:
             True if successful, False otherwise
         """
         try:
-            if os.path.exists(temp_dir) and os.path.isdir(temp_dir):
+            import shutil
+            
+            if os.path.isdir(temp_dir):
                 shutil.rmtree(temp_dir)
                 logger.debug(f"Cleaned up temporary directory: {temp_dir}")
                 return True
@@ -1209,24 +1577,14 @@ class FileHandler:
         Returns:
             Dictionary with supported formats
         """
-        import_formats = [
-            '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp'
-        ]
-        
-        # Add HEIC/HEIF if PIL supports it
-        if PIL_AVAILABLE:
-            try:
-                from PIL import features
-                if features.check('libjpeg_turbo'):
-                    import_formats.extend(['.heic', '.heif'])
-            except (ImportError, AttributeError):
-                pass
+        # Return new lists so callers can modify them freely
+        import_formats = list(_get_import_formats())
         
         export_formats = {
             'CSV': ['.csv'],
             'JSON': ['.json'],
             'Text': ['.txt'],
-            'Excel': ['.xlsx'] if PANDAS_AVAILABLE else [],
+            'Excel': ['.xlsx'] if OPENPYXL_AVAILABLE else [],
             'PDF': ['.pdf'] if REPORTLAB_AVAILABLE else [],
             'HTML': ['.html'],
             'YAML': ['.yaml', '.yml'] if YAML_AVAILABLE else []
@@ -1237,15 +1595,87 @@ class FileHandler:
             'export': export_formats
         }
     
+    def _save_as(self, metadata: Dict[str, Any], output_format: str, output_file: str, **kwargs) -> bool:
+        """
+        Save metadata in the given format.
+        
+        Args:
+            metadata: Dictionary containing metadata
+            output_format: Format to save in (a key of EXPORT_METHODS)
+            output_file: Path to the output file
+            **kwargs: Options passed on to the PDF and HTML reports
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        save_method = getattr(self, EXPORT_METHODS[output_format])
+        if output_format in REPORT_FORMATS:
+            return save_method(metadata, output_file, **kwargs)
+        return save_method(metadata, output_file)
+    
+    def save_all(self, metadata: Dict[str, Any], formats: Dict[str, str], **kwargs) -> Dict[str, bool]:
+        """
+        Save metadata in several formats at once.
+        
+        Each format is written by its own worker thread, so slow outputs
+        such as PDF reports overlap with the other files instead of
+        running one after another.
+        
+        Args:
+            metadata: Dictionary containing metadata
+            formats: Output format (csv, json, etc.) mapped to its output file
+            **kwargs: Options passed on to the PDF and HTML reports
+            
+        Returns:
+            Dictionary mapping each format to whether it was saved
+        """
+        results = {}
+        futures = {}
+        
+        for output_format in formats:
+            if output_format not in EXPORT_METHODS:
+                logger.error(f"Unsupported output format: {output_format}")
+                results[output_format] = False
+        
+        supported = [fmt for fmt in formats if fmt not in results]
+        if not supported:
+            return results
+        
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(supported), EXPORT_MAX_WORKERS)) as executor:
+            for output_format in supported:
+                futures[output_format] = executor.submit(
+                    self._save_as, metadata, output_format, formats[output_format], **kwargs
+                )
+        
+        for output_format, future in futures.items():
+            try:
+                results[output_format] = future.result()
+            except Exception as e:
+                logger.error(f"Error saving metadata as {output_format}: {e}")
+                results[output_format] = False
+        
+        return results
+    
     def batch_process(self, file_paths: List[str], output_dir: str, output_format: str, **kwargs) -> Dict[str, Any]:
         """
         Process multiple files in batch mode.
         
+        With max_workers above 1, files are processed concurrently by a
+        thread pool; results and errors are reported in the order of
+        file_paths.
+        
         Args:
             file_paths: List of file paths to process
             output_dir: Directory to save output files
             output_format: Format to save in (csv, json, etc.)
             **kwargs: Additional options for specific formats
+                - metadata_extractor: Callable returning the metadata of a file,
+                  or a metadata dictionary used for every file
+                - max_workers: Number of files processed at the same time
+                  (default: BATCH_MAX_WORKERS, which processes files one by
+                  one); a callable metadata_extractor must be thread-safe
+                  when this is above 1
             
         Returns:
             Dictionary with processing results
@@ -1267,78 +1697,82 @@ class FileHandler:
                 results['errors'].append(f"Failed to create output directory: {str(e)}")
                 return results
         
-        # Process each file
-        for file_path in file_paths:
+        # Extract metadata (this would be done by the MetadataExtractor class)
+        # For this file, we'll just assume metadata is provided externally;
+        # it and the other settings shared by every file are looked up once
+        metadata = kwargs.get('metadata_extractor', None)
+        extract_metadata = callable(metadata)
+        format_supported = output_format in EXPORT_METHODS
+        output_suffix = f"_metadata.{output_format}"
+        max_workers = kwargs.get('max_workers', BATCH_MAX_WORKERS)
+        if not isinstance(max_workers, int) or max_workers < 1:
+            logger.warning(f"Invalid max_workers {max_workers!r}, processing files one by one")
+            max_workers = 1
+        
+        def process_file(file_path):
+            """Process one file, returning the result counter to increment and an error or None."""
             try:
                 # Check if file exists and is a valid image
                 if not os.path.exists(file_path):
-                    results['skipped'] += 1
-                    results['errors'].append(f"File not found: {file_path}")
-                    continue
+                    return 'skipped', f"File not found: {file_path}"
                 
                 if not self.is_valid_image(file_path):
-                    results['skipped'] += 1
-                    results['errors'].append(f"Not a valid image: {file_path}")
-                    continue
+                    return 'skipped', f"Not a valid image: {file_path}"
                 
                 # Get base filename without extension
                 base_name = os.path.splitext(os.path.basename(file_path))[0]
                 
                 # Create output filename
-                output_file = os.path.join(output_dir, f"{base_name}_metadata.{output_format}")
-                
-                # Extract metadata (this would be done by the MetadataExtractor class)
-                # For this file, we'll just assume metadata is provided externally
-                metadata = kwargs.get('metadata_extractor', None)
+                output_file = os.path.join(output_dir, base_name + output_suffix)
                 
                 if metadata is None:
-                    results['skipped'] += 1
-                    results['errors'].append(f"No metadata extractor provided for: {file_path}")
-                    continue
+                    return 'skipped', f"No metadata extractor provided for: {file_path}"
                 
                 # Extract metadata for this file
-                if callable(metadata):
+                if extract_metadata:
                     try:
                         file_metadata = metadata(file_path)
                     except Exception as e:
-                        results['failed'] += 1
-                        results['errors'].append(f"Metadata extraction failed for {file_path}: {str(e)}")
-                        continue
+                        return 'failed', f"Metadata extraction failed for {file_path}: {str(e)}"
                 else:
                     # Assume metadata is a dictionary
                     file_metadata = metadata
                 
                 # Save metadata in the specified format
-                success = False
-                
-                if output_format == 'csv':
-                    success = self.save_csv(file_metadata, output_file)
-                elif output_format == 'json':
-                    success = self.save_json(file_metadata, output_file)
-                elif output_format == 'txt':
-                    success = self.save_text(file_metadata, output_file)
-                elif output_format == 'xlsx':
-                    success = self.save_excel(file_metadata, output_file)
-                elif output_format == 'pdf':
-                    success = self.save_pdf(file_metadata, output_file, image_path=file_path)
-                elif output_format == 'html':
-                    success = self.save_html(file_metadata, output_file, image_path=file_path)
-                elif output_format in ('yaml', 'yml'):
-                    success = self.save_yaml(file_metadata, output_file)
-                else:
-                    results['skipped'] += 1
-                    results['errors'].append(f"Unsupported output format: {output_format}")
-                    continue
+                if not format_supported:
+                    return 'skipped', f"Unsupported output format: {output_format}"
                 
-                if success:
-                    results['successful'] += 1
-                else:
-                    results['failed'] += 1
-                    results['errors'].append(f"Failed to save metadata for: {file_path}")
+                if self._save_as(file_metadata, output_format, output_file, image_path=file_path):
+                    return 'successful', None
+                return 'failed', f"Failed to save metadata for: {file_path}"
                 
             except Exception as e:
-                results['failed'] += 1
-                results['errors'].append(f"Error processing {file_path}: {str(e)}")
+                return 'failed', f"Error processing {file_path}: {str(e)}"
+        
+        # Process the files, collecting outcomes in input order
+        if max_workers == 1 or len(file_paths) <= 1:
+            outcomes = map(process_file, file_paths)
+        else:
+            # Files sharing a base name write the same output and preview
+            # files, so each such group is processed in order by one worker
+            groups = defaultdict(list)
+            for index, file_path in enumerate(file_paths):
+                base_name = os.path.splitext(os.path.basename(file_path))[0]
+                groups[os.path.normcase(base_name)].append(index)
+            
+            def process_group(indices):
+                return [(index, process_file(file_paths[index])) for index in indices]
+            
+            outcomes = [None] * len(file_paths)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for group_outcomes in executor.map(process_group, groups.values()):
+                    for index, outcome in group_outcomes:
+                        outcomes[index] = outcome
+        
+        for status, error in outcomes:
+            results[status] += 1
+            if error is not None:
+                results['errors'].append(error)
         
         return results
     
@@ -1417,8 +1851,19 @@ class FileHandler:
             # Convert non-serializable objects to strings
             serializable_data = self._make_serializable(session_data)
             
-            with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(serializable_data, f, indent=2)
+            data = None
+            if ORJSON_AVAILABLE and not _has_non_finite_float(serializable_data):
+                try:
+                    data = orjson.dumps(serializable_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                except TypeError:
+                    # orjson rejects integers beyond 64 bits; leave those to
+                    # the json module
+                    data = None
+            if data is None:
+                data = json.dumps(serializable_data, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            with _atomic_open(session_file, 'wb') as f:
+                f.write(data)
             
             logger.info(f"Saved session to: {session_file}")
             return True
@@ -1442,8 +1887,19 @@ class FileHandler:
                 logger.error(f"Session file not found: {session_file}")
                 return None
             
-            with open(session_file, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
+            with open(session_file, 'rb') as f:
+                data = f.read()
+            
+            session_data = None
+            if ORJSON_AVAILABLE:
+                try:
+                    session_data = orjson.loads(data)
+                except ValueError:
+                    # Sessions saved by the json module may contain NaN or
+                    # Infinity, which orjson does not accept
+                    session_data = None
+            if session_data is None:
+                session_data = json.loads(data)
             
             logger.info(f"Loaded session from: {session_file}")
             return session_data
@@ -1456,23 +1912,49 @@ class FileHandler:
         """
         Calculate the hash of a file.
         
+        The file is memory-mapped and fed to the hash in large slices, so
+        no intermediate bytes objects are created. Files that cannot be
+        mapped are read into a buffer that is reused by the calling thread.
+        
         Args:
             file_path: Path to the file
-            algorithm: Hash algorithm to use (md5, sha1, sha256, etc.)
+            algorithm: Hash algorithm to use (md5, sha1, sha256, etc., or
+                blake3 if the blake3 package is installed)
             
         Returns:
             File hash or None if calculation failed
         """
         try:
-            import hashlib
-            
             # Get the hash algorithm
-            hash_func = getattr(hashlib, algorithm)()
+            if algorithm == 'blake3':
+                from blake3 import blake3
+                hash_func = blake3(max_threads=blake3.AUTO)
+            else:
+                import hashlib
+                hash_func = getattr(hashlib, algorithm)()
             
             # Calculate hash
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    hash_func.update(chunk)
+                file_stat = os.fstat(f.fileno())
+                
+                if stat.S_ISREG(file_stat.st_mode) and file_stat.st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            for offset in range(0, len(view), HASH_CHUNK_SIZE):
+                                hash_func.update(view[offset:offset + HASH_CHUNK_SIZE])
+                        finally:
+                            view.release()
+                else:
+                    # Empty files, pipes and files whose size the system does
+                    # not report cannot be memory-mapped; read them into this
+                    # thread's reusable buffer instead
+                    view = _get_hash_buffer()
+                    while True:
+                        size = f.readinto(view)
+                        if not size:
+                            break
+                        hash_func.update(view[:size])
             
             return hash_func.hexdigest()
             
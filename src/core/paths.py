@@ -0,0 +1,21 @@
+"""
+Paths Module
+
+This module defines the application's directory layout and creates the
+directories it needs at runtime.
+"""
+
+import os
+
+# Project root directory (the directory containing main.py)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Application directories
+LOGS_DIR = os.path.join(ROOT_DIR, "logs")
+RESOURCES_DIR = os.path.join(ROOT_DIR, "resources")
+ICONS_DIR = os.path.join(RESOURCES_DIR, "icons")
+
+
+def ensure_paths() -> None:
+    """Create the directories the application writes to, if missing."""
+    os.makedirs(LOGS_DIR, exist_ok=True)
@@ -6,17 +6,26 @@ including CSV, JSON, XML, PDF, HTML, and more.
 """
 
 import os
+import re
 import csv
 import json
 import logging
 import xml.dom.minidom
 import xml.etree.ElementTree as ET
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union, TextIO, BinaryIO, Tuple
+from html import escape as html_escape
+from typing import Dict, Any, List, Optional, Union, TextIO, BinaryIO, Tuple, Iterator
+
+from ..core.constants import METADATA_CATEGORY_ORDER, make_metadata_categorizer
 
 # Get the package logger
 logger = logging.getLogger(__name__)
 
+# Report category of a metadata key; EXIF, IPTC and XMP prefixes only
+# count when followed by ':' or ' ', e.g. 'EXIF:Make'
+_metadata_category = make_metadata_categorizer(r'(GPS)|(EXIF[: ])|(IPTC[: ])|(XMP[: ])')
+
 # Try to import optional dependencies with fallbacks
 try:
     import pandas as pd
@@ -38,6 +47,9 @@ except ImportError:
 
 try:
     import yaml
+    
+    # Dumper backed by libyaml's emitter when PyYAML was built with it
+    YAML_DUMPER = getattr(yaml, 'CDumper', yaml.Dumper)
     YAML_AVAILABLE = True
 except ImportError:
     logger.info("PyYAML library not available. YAML export will be limited.")
@@ -609,13 +621,18 @@ class MetadataExporter:
                 
                 # Replace placeholders in template
                 html = self._fill_html_template(template, metadata, image_path, title, company_name)
+                
+                # Write to file
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(html)
             else:
-                # Generate HTML from scratch
-                html = self._generate_html_report(metadata, image_path, include_preview, title, company_name, css)
-            
-            # Write to file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html)
+                # Generate HTML from scratch; the report is joined before the
+                # file is opened, so a failure part way leaves no partial file
+                html = '\n'.join(
+                    self._iter_html_lines(metadata, image_path, include_preview, title, company_name, css)
+                )
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(html)
             
             logger.info(f"Exported metadata to HTML: {output_file}")
             return True
@@ -651,7 +668,8 @@ class MetadataExporter:
             serializable_metadata = self._make_serializable(metadata)
             
             with open(output_file, 'w', encoding=encoding) as f:
-                yaml.dump(serializable_metadata, f, default_flow_style=default_flow_style, sort_keys=False)
+                yaml.dump(serializable_metadata, f, Dumper=YAML_DUMPER,
+                          default_flow_style=default_flow_style, sort_keys=False)
             
             logger.info(f"Exported metadata to YAML: {output_file}")
             return True
@@ -1039,72 +1057,22 @@ class MetadataExporter:
         Returns:
             Dictionary with categorized metadata
         """
-        categories = {
-            'Basic Information': {},
-            'Camera Information': {},
-            'Lens Information': {},
-            'Exposure Information': {},
-            'GPS Information': {},
-            'EXIF Data': {},
-            'IPTC Data': {},
-            'XMP Data': {},
-            'File Information': {},
-            'Other Metadata': {}
-        }
-        
-        # Skip these keys as they're handled separately
-        skip_keys = ['PrivacyAssessment']
+        # Only categories that receive a key are created
+        categories = defaultdict(dict)
         
         for key, value in metadata.items():
-            if key in skip_keys:
+            # Skip the privacy assessment as it's handled separately
+            if key == 'PrivacyAssessment':
                 continue
             
-            # File information
-            if key.startswith('File') or key in ['FileName', 'FilePath', 'FileSize', 'FileSizeFormatted']:
-                categories['File Information'][key] = value
-            
-            # Basic information
-            elif key in ['ImageWidth', 'ImageHeight', 'ImageSize', 'Megapixels', 'AspectRatio', 'ColorSpace', 'BitsPerPixel']:
-                categories['Basic Information'][key] = value
-            
-            # Camera information
-            elif key in ['Make', 'Model', 'DeviceMake', 'DeviceModel', 'DeviceType', 'Software', 'CameraSerialNumber', 'DeviceSerialNumber']:
-                categories['Camera Information'][key] = value
-            
-            # Lens information
-            elif 'Lens' in key or key in ['FocalLength', 'FocalLength35mm']:
-                categories['Lens Information'][key] = value
-            
-            # Exposure information
-            elif key in ['Aperture', 'ShutterSpeed', 'ISO', 'ExposureTime', 'ExposureProgram', 'ExposureMode', 'ExposureCompensation', 'MeteringMode', 'Flash', 'WhiteBalance']:
-                categories['Exposure Information'][key] = value
-            
-            # GPS information
-            elif key.startswith('GPS') or key in ['Latitude', 'Longitude', 'Altitude', 'Location', 'LocationName', 'City', 'State', 'Country']:
-                categories['GPS Information'][key] = value
-            
-            # EXIF data
-            elif key.startswith('EXIF:') or key.startswith('EXIF '):
-                categories['EXIF Data'][key] = value
-            
-            # IPTC data
-            elif key.startswith('IPTC:') or key.startswith('IPTC '):
-                categories['IPTC Data'][key] = value
-            
-            # XMP data
-            elif key.startswith('XMP:') or key.startswith('XMP '):
-                categories['XMP Data'][key] = value
-            
-            # Other metadata
-            else:
-                categories['Other Metadata'][key] = value
+            categories[_metadata_category(key)][key] = value
         
-        # Remove empty categories
-        return {k: v for k, v in categories.items() if v}
+        # Return the categories in report order
+        return {name: categories[name] for name in METADATA_CATEGORY_ORDER if name in categories}
     
-    def _generate_html_report(self, metadata: Dict[str, Any], image_path: Optional[str], include_preview: bool, title: str, company_name: str, custom_css: str) -> str:
+    def _iter_html_lines(self, metadata: Dict[str, Any], image_path: Optional[str], include_preview: bool, title: str, company_name: str, custom_css: str) -> Iterator[str]:
         """
-        Generate an HTML report from metadata.
+        Generate the lines of an HTML report, without line endings.
         
         Args:
             metadata: Dictionary containing metadata
@@ -1114,11 +1082,11 @@ class MetadataExporter:
             company_name: Company name
             custom_css: Custom CSS string
             
-        Returns:
-            HTML string
+        Yields:
+            Lines of the HTML document
         """
         # Start HTML content
-        html = [
+        yield from (
             "<!DOCTYPE html>",
             "<html>",
             "<head>",
@@ -1143,20 +1111,20 @@ class MetadataExporter:
             "</head>",
             "<body>",
             f"    <h1>{title}</h1>"
-        ]
+        )
         
         # Add company name if provided
         if company_name:
-            html.append(f"    <p>Prepared by: {company_name}</p>")
+            yield f"    <p>Prepared by: {company_name}</p>"
         
         # Add timestamp
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        html.append(f"    <p class='timestamp'>Generated: {timestamp}</p>")
+        yield f"    <p class='timestamp'>Generated: {timestamp}</p>"
         
         # Add image preview if available
         if include_preview and image_path and os.path.exists(image_path):
-            html.append("    <div class='metadata-section'>")
-            html.append("        <h2>Image Preview</h2>")
+            yield "    <div class='metadata-section'>"
+            yield "        <h2>Image Preview</h2>"
             
             # Create a copy of the image in the same directory as the HTML file
             if PIL_AVAILABLE:
@@ -1168,32 +1136,34 @@ class MetadataExporter:
                     # Create preview filename
                     preview_filename = os.path.join(preview_dir, f"preview_{os.path.basename(image_path)}")
                     
-                    # Create preview image
-                    img = Image.open(image_path)
-                    img.thumbnail((500, 500), Image.LANCZOS)
-                    img.save(preview_filename)
+                    # Create preview image; the JPEG decoder downscales to about
+                    # twice the preview size, so the LANCZOS pass has less to do
+                    with Image.open(image_path) as img:
+                        img.draft(img.mode, (1000, 1000))
+                        img.thumbnail((500, 500), Image.LANCZOS)
+                        img.save(preview_filename)
                     
                     # Add relative path to HTML
                     rel_path = os.path.relpath(preview_filename, os.path.dirname(os.path.abspath(image_path)))
-                    html.append(f"        <img src='{rel_path}' class='image-preview' alt='Image preview'>")
+                    yield f"        <img src='{rel_path}' class='image-preview' alt='Image preview'>"
                 except Exception as e:
                     logger.warning(f"Error creating image preview for HTML: {e}")
                     # Fallback to direct reference
-                    html.append(f"        <img src='file://{image_path.replace(' ', '%20')}' class='image-preview' alt='Image preview'>")
+                    yield f"        <img src='file://{image_path.replace(' ', '%20')}' class='image-preview' alt='Image preview'>"
             else:
                 # Direct reference if PIL is not available
-                html.append(f"        <img src='file://{image_path.replace(' ', '%20')}' class='image-preview' alt='Image preview'>")
+                yield f"        <img src='file://{image_path.replace(' ', '%20')}' class='image-preview' alt='Image preview'>"
             
-            html.append("    </div>")
+            yield "    </div>"
         
         # Categorize metadata
         categories = self._categorize_metadata(metadata)
         
         # Add each category
         for category_name, category_data in categories.items():
-            html.append("    <div class='metadata-section'>")
-            html.append(f"        <h2>{category_name}</h2>")
-            html.append("        <table class='metadata-table'>")
+            yield "    <div class='metadata-section'>"
+            yield f"        <h2>{category_name}</h2>"
+            yield "        <table class='metadata-table'>"
             
             # Flatten the category data
             flattened_data = self._flatten_dict(category_data)
@@ -1204,58 +1174,56 @@ class MetadataExporter:
                 formatted_value = self._format_value(value)
                 
                 # Escape HTML special characters
-                key_html = key.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                value_html = str(formatted_value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                key_html = html_escape(key, quote=False)
+                value_html = html_escape(str(formatted_value), quote=False)
                 
-                html.append(f"            <tr><th>{key_html}</th><td>{value_html}</td></tr>")
+                yield f"            <tr><th>{key_html}</th><td>{value_html}</td></tr>"
             
-            html.append("        </table>")
-            html.append("    </div>")
+            yield "        </table>"
+            yield "    </div>"
         
         # Add privacy assessment if available
         if 'PrivacyAssessment' in metadata:
-            html.append("    <div class='metadata-section'>")
-            html.append("        <h2>Privacy Assessment</h2>")
-            html.append("        <table class='metadata-table'>")
+            yield "    <div class='metadata-section'>"
+            yield "        <h2>Privacy Assessment</h2>"
+            yield "        <table class='metadata-table'>"
             
             privacy = metadata['PrivacyAssessment']
             
             if 'PrivacyRisk' in privacy:
                 risk_level = privacy['PrivacyRisk']
                 risk_class = f"risk-{risk_level.lower()}"
-                html.append(f"            <tr><th>Privacy Risk Level</th><td class='{risk_class}'>{risk_level}</td></tr>")
+                yield f"            <tr><th>Privacy Risk Level</th><td class='{risk_class}'>{risk_level}</td></tr>"
             
             if 'SensitiveDataPresent' in privacy:
-                html.append(f"            <tr><th>Sensitive Data Present</th><td>{'Yes' if privacy['SensitiveDataPresent'] else 'No'}</td></tr>")
+                yield f"            <tr><th>Sensitive Data Present</th><td>{'Yes' if privacy['SensitiveDataPresent'] else 'No'}</td></tr>"
             
             if 'SensitiveFields' in privacy and privacy['SensitiveFields']:
                 fields = ', '.join(privacy['SensitiveFields'])
-                html.append(f"            <tr><th>Sensitive Fields</th><td>{fields}</td></tr>")
+                yield f"            <tr><th>Sensitive Fields</th><td>{fields}</td></tr>"
             
-            html.append("        </table>")
+            yield "        </table>"
             
             # Add recommendations
             if 'Recommendations' in privacy and privacy['Recommendations']:
-                html.append("        <h3>Recommendations:</h3>")
-                html.append("        <ul>")
+                yield "        <h3>Recommendations:</h3>"
+                yield "        <ul>"
                 
                 for recommendation in privacy['Recommendations']:
-                    html.append(f"            <li>{recommendation}</li>")
+                    yield f"            <li>{recommendation}</li>"
                 
-                html.append("        </ul>")
+                yield "        </ul>"
             
-            html.append("    </div>")
+            yield "    </div>"
         
         # Add footer
-        html.append("    <div class='footer'>")
-        html.append("        Generated by Image Metadata Extractor")
-        html.append("    </div>")
+        yield "    <div class='footer'>"
+        yield "        Generated by Image Metadata Extractor"
+        yield "    </div>"
         
         # Close HTML
-        html.append("</body>")
-        html.append("</html>")
-        
-        return '\n'.join(html)
+        yield "</body>"
+        yield "</html>"
     
     def _fill_html_template(self, template: str, metadata: Dict[str, Any], image_path: Optional[str], title: str, company_name: str) -> str:
         """
@@ -1293,8 +1261,8 @@ class MetadataExporter:
                 formatted_value = self._format_value(value)
                 
                 # Escape HTML special characters
-                key_html = key.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                value_html = str(formatted_value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                key_html = html_escape(key, quote=False)
+                value_html = html_escape(str(formatted_value), quote=False)
                 
                 category_html += f"    <tr><th>{key_html}</th><td>{value_html}</td></tr>\n"
             
@@ -1368,10 +1336,12 @@ class MetadataExporter:
                     # Create preview filename
                     preview_filename = os.path.join(preview_dir, f"preview_{os.path.basename(image_path)}")
                     
-                    # Create preview image
-                    img = Image.open(image_path)
-                    img.thumbnail((500, 500), Image.LANCZOS)
-                    img.save(preview_filename)
+                    # Create preview image; the JPEG decoder downscales to about
+                    # twice the preview size, so the LANCZOS pass has less to do
+                    with Image.open(image_path) as img:
+                        img.draft(img.mode, (1000, 1000))
+                        img.thumbnail((500, 500), Image.LANCZOS)
+                        img.save(preview_filename)
                     
                     # Add relative path to HTML
                     rel_path = os.path.relpath(preview_filename, os.path.dirname(os.path.abspath(image_path)))
@@ -12,6 +12,8 @@ import tempfile
 from typing import Tuple, Optional, List, Dict, Any, Union
 from pathlib import Path
 
+from ..core.constants import SUPPORTED_IMAGE_FORMATS
+
 # Get the package logger
 logger = logging.getLogger(__name__)
 
@@ -47,9 +49,8 @@ def is_valid_image(file_path: str) -> bool:
     
     # Check file extension
     _, ext = os.path.splitext(file_path)
-    valid_extensions = ['.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.webp', '.heic', '.heif', '.cr2', '.nef']
     
-    if ext.lower() not in valid_extensions:
+    if ext.lower() not in SUPPORTED_IMAGE_FORMATS:
         logger.debug(f"File has invalid extension: {ext}")
         return False
     
@@ -90,7 +91,7 @@ def is_valid_image(file_path: str) -> bool:
             logger.debug(f"Error checking MIME type: {e}")
     
     # If we can't verify with PIL or magic, just check the extension
-    return ext.lower() in valid_extensions
+    return ext.lower() in SUPPORTED_IMAGE_FORMATS
 
 
 def is_valid_path(path: str) -> bool: